@@ -3,22 +3,116 @@ AI-powered abstractive summarization using OpenRouter API
 """
 
 import os
+import asyncio
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import httpx
+import orjson
 import re
 import logging
-from typing import Optional, Dict, List
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+import functools
+import itertools
+from typing import Optional, Dict, List, AsyncIterator, Tuple
+from llm_cache import CacheBackend, get_cache, make_cache_key
 
 logger = logging.getLogger(__name__)
 
+# Outermost {...} block, for models that wrap JSON output in prose or code fences
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Longest article text sent in a prompt, roughly 6000 tokens
+MAX_PROMPT_CHARS = 24000
+
+# Leading characters of the article used when generating a title on its own
+TITLE_CONTEXT_CHARS = 1000
+
+_WS_RE = re.compile(r'\s+')
+
+# Text between sentence terminators, used by the fallback summary
+_SENTENCE_RE = re.compile(r'[^.!?]+')
+
+# Title returned when no AI title could be generated
+PLACEHOLDER_TITLE = "Article Summary"
+
+# "Title:" label some models prepend to generated titles
+_TITLE_PREFIX_RE = re.compile(r'^\s*Title:\s*', re.IGNORECASE)
+_TITLE_STRIP_CHARS = '"\' \t\n'
+
+# Numbered ("1.") or bulleted ("•", "-") key point line; group 1 is the point text
+_BULLET_RE = re.compile(r'^\s*(?:\d+\.|[•\-])\s*(.+?)\s*$')
+
+# Prompt templates, split around the article text. Headers are formatted once per
+# parameter set (see _prompt_header) and the article is joined in a single copy.
+SUMMARY_PROMPT_HEADER = """Please provide a concise, accurate summary of the following article in {} words or less.
+Focus on the key points, main events, and important information. Write in a neutral, journalistic style.
+
+Article:
+"""
+SUMMARY_PROMPT_SUFFIX = "\n\nSummary:"
+
+ANALYSIS_PROMPT_HEADER = """Analyze the following article and respond with strict JSON using exactly these keys:
+- "summary": a concise, accurate summary in {} words or less. Focus on the key points, main events, and important information. Write in a neutral, journalistic style.
+- "title": a concise, engaging title (10 words or less).
+- "key_points": an array of {} key points, each a single, clear sentence.
+
+Article:
+"""
+ANALYSIS_PROMPT_SUFFIX = "\n\nJSON:"
+
+TITLE_PROMPT_HEADER = """Based on the following article, generate a concise, engaging title (10 words or less).
+Make it catchy and informative.
+
+Article:
+"""
+TITLE_PROMPT_SUFFIX = "\n\nTitle:"
+
+KEY_POINTS_PROMPT_HEADER = """Extract {} key points from the following article.
+Each point should be a single, clear sentence. Focus on the most important information.
+
+Article:
+"""
+KEY_POINTS_PROMPT_SUFFIX = "\n\nKey points (numbered):"
+
+@functools.lru_cache(maxsize=64)
+def _prompt_header(template: str, *args) -> str:
+    """Format a prompt header; callers reuse a handful of lengths/counts"""
+    return template.format(*args)
+
+# Retry policy for rate-limited or failed OpenRouter calls, shared by the sync and async paths
+_RETRY_TOTAL = 2
+_RETRY_BACKOFF = 0.3
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Cap on in-flight async OpenRouter calls, to stay under the account's rate limit
+OPENROUTER_MAX_CONCURRENCY = int(os.getenv('OPENROUTER_MAX_CONCURRENCY', '8'))
+
+# Shared async client and concurrency cap. Both are bound to the event loop they
+# are first used in, so they are created inside the running loop (see
+# open_clients) rather than at import time.
+_async_client: Optional[httpx.AsyncClient] = None
+_OPENROUTER_SEM: Optional[asyncio.Semaphore] = None
+_clients_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def _async_resources() -> Tuple[httpx.AsyncClient, asyncio.Semaphore]:
+    """The shared async client and semaphore for the running event loop, created on first use"""
+    global _async_client, _OPENROUTER_SEM, _clients_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _clients_loop is not loop:
+        # HTTP/2 multiplexes concurrent OpenRouter calls over one connection
+        _async_client = httpx.AsyncClient(
+            http2=True,
+            timeout=30,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+        )
+        _OPENROUTER_SEM = asyncio.Semaphore(OPENROUTER_MAX_CONCURRENCY)
+        _clients_loop = loop
+    return _async_client, _OPENROUTER_SEM
+
 class AISummarizer:
     """Handles AI-powered abstractive summarization using OpenRouter"""
 
-    def __init__(self):
+    def __init__(self, provider_sort: Optional[str] = 'throughput', cache: Optional[CacheBackend] = None):
         self.api_key = os.getenv('OPENROUTER_API_KEY')
         self.api_base = "https://openrouter.ai/api/v1"
 
@@ -28,6 +122,24 @@ class AISummarizer:
         # Default model for summarization
         self.default_model = "z-ai/glm-4.5-air:free"
 
+        # OpenRouter provider routing: 'throughput', 'latency', 'price' or None for default
+        self.provider_sort = provider_sort
+
+        # Completions are cached by (model, prompt) so repeat articles skip the API
+        self.cache = cache if cache is not None else get_cache()
+
+        # Reuse connections to OpenRouter instead of paying a TCP+TLS handshake per call
+        self.session = requests.Session()
+        self.session.headers.update(self._build_headers())
+        retries = Retry(
+            total=_RETRY_TOTAL,
+            backoff_factor=_RETRY_BACKOFF,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=frozenset(['POST']),
+            raise_on_status=False
+        )
+        self.session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries))
+
     def summarize(self, text: str, max_length: int = 200) -> Dict:
         """
         Generate an abstractive summary using AI
@@ -39,66 +151,200 @@ class AISummarizer:
         Returns:
             Dict: Summary data with AI-generated text
         """
+        if self._is_short_text(text, max_length):
+            return self._skipped_summary(text)
+
         if not self.api_key:
-            return {
-                'summary': self._fallback_summary(text, max_length),
-                'method': 'fallback',
-                'model': 'none',
-                'error': 'API key not configured'
-            }
+            return self._missing_key_summary(text, max_length)
 
         try:
             # Prepare the prompt
             prompt = self._create_summarization_prompt(text, max_length)
 
             # Make API request
-            response = self._make_api_request(prompt)
+            response = self._make_api_request(prompt, self._max_tokens(max_length))
 
-            if response and 'choices' in response:
-                ai_summary = response['choices'][0]['message']['content'].strip()
+            return self._parse_summary_response(response, text, max_length)
 
-                return {
-                    'summary': ai_summary,
-                    'method': 'ai_abstractive',
-                    'model': response.get('model', 'unknown'),
-                    'usage': response.get('usage', {}),
-                    'provider': 'openrouter'
-                }
-            else:
-                logger.error("Invalid API response format")
-                return {
-                    'summary': self._fallback_summary(text, max_length),
-                    'method': 'fallback',
-                    'error': 'Invalid API response'
-                }
+        except Exception as e:
+            logger.error(f"Error in AI summarization: {str(e)}")
+            return self._error_summary(text, max_length, e)
+
+    async def a_summarize(self, text: str, max_length: int = 200) -> Dict:
+        """Async version of summarize() that does not block the event loop"""
+        if self._is_short_text(text, max_length):
+            return self._skipped_summary(text)
+
+        if not self.api_key:
+            return self._missing_key_summary(text, max_length)
+
+        try:
+            prompt = self._create_summarization_prompt(text, max_length)
+            response = await self._a_make_api_request(prompt, self._max_tokens(max_length))
+            return self._parse_summary_response(response, text, max_length)
 
         except Exception as e:
             logger.error(f"Error in AI summarization: {str(e)}")
+            return self._error_summary(text, max_length, e)
+
+    async def stream_summarize(self, text: str, max_length: int = 200) -> AsyncIterator[str]:
+        """
+        Stream an abstractive summary as it is generated
+
+        Args:
+            text (str): The text to summarize
+            max_length (int): Maximum length of summary in words
+
+        Yields:
+            str: Pieces of summary text, in order
+        """
+        if self._is_short_text(text, max_length):
+            yield text.strip()
+            return
+
+        if not self.api_key:
+            yield self._fallback_summary(text, max_length)
+            return
+
+        prompt = self._create_summarization_prompt(text, max_length)
+        cache_key = make_cache_key(self.default_model, prompt)
+        cached = await self.cache.aget(cache_key)
+        if cached is not None and 'choices' in cached:
+            yield cached['choices'][0]['message']['content'].strip()
+            return
+
+        data = self._build_payload(prompt, self._max_tokens(max_length))
+        data['stream'] = True
+        parts = []
+        model = None
+        finish_reason = None
+
+        try:
+            client, sem = _async_resources()
+            async with sem, client.stream(
+                'POST',
+                f"{self.api_base}/chat/completions",
+                headers=self._build_headers(),
+                content=orjson.dumps(data)
+            ) as response:
+                if response.status_code != 200:
+                    body = await response.aread()
+                    logger.error(f"API request failed: {response.status_code} - {body.decode(errors='replace')}")
+                    yield self._fallback_summary(text, max_length)
+                    return
+
+                # Server-sent events; lines starting with ':' are keep-alive comments
+                async for line in response.aiter_lines():
+                    if not line.startswith('data:'):
+                        continue
+                    payload = line[5:].strip()
+                    if payload == '[DONE]':
+                        break
+
+                    chunk = orjson.loads(payload)
+                    model = chunk.get('model', model)
+                    choices = chunk.get('choices') or [{}]
+                    finish_reason = choices[0].get('finish_reason') or finish_reason
+                    delta = choices[0].get('delta', {}).get('content')
+                    if delta:
+                        parts.append(delta)
+                        yield delta
+
+        except Exception as e:
+            logger.error(f"Error in streaming AI summarization: {str(e)}")
+            if not parts:
+                yield self._fallback_summary(text, max_length)
+            return
+
+        # Cached like a non-streamed completion, so a summary cut off at
+        # max_tokens is not replayed
+        result = {
+            'model': model or self.default_model,
+            'choices': [{
+                'message': {'role': 'assistant', 'content': ''.join(parts)},
+                'finish_reason': finish_reason
+            }]
+        }
+        if self._is_cacheable_response(result):
+            await self.cache.aset(cache_key, result)
+
+    def _is_short_text(self, text: str, max_length: int) -> bool:
+        """True if the text is already no longer than the requested summary"""
+        return len(text.split()) <= max_length
+
+    def _skipped_summary(self, text: str) -> Dict:
+        """Summary data for text too short to be worth an API call"""
+        return {
+            'summary': text.strip(),
+            'method': 'skipped',
+            'model': 'none'
+        }
+
+    def _missing_key_summary(self, text: str, max_length: int) -> Dict:
+        """Fallback summary returned when no API key is configured"""
+        return {
+            'summary': self._fallback_summary(text, max_length),
+            'method': 'fallback',
+            'model': 'none',
+            'error': 'API key not configured'
+        }
+
+    def _error_summary(self, text: str, max_length: int, error: Exception) -> Dict:
+        """Fallback summary returned when the API call raised"""
+        return {
+            'summary': self._fallback_summary(text, max_length),
+            'method': 'fallback',
+            'error': str(error)
+        }
+
+    def _parse_summary_response(self, response: Optional[Dict], text: str, max_length: int) -> Dict:
+        """Turn an API response into summary data"""
+        if response and 'choices' in response:
+            ai_summary = (response['choices'][0]['message']['content'] or '').strip()
+            if not ai_summary:
+                logger.error("Empty API response")
+                return self._error_summary(text, max_length, ValueError('Empty AI response'))
+
             return {
-                'summary': self._fallback_summary(text, max_length),
-                'method': 'fallback',
-                'error': str(e)
+                'summary': ai_summary,
+                'method': 'ai_abstractive',
+                'model': response.get('model', 'unknown'),
+                'usage': response.get('usage', {}),
+                'provider': 'openrouter'
             }
 
-    def _create_summarization_prompt(self, text: str, max_length: int) -> str:
-        """Create a prompt for summarization"""
-        return f"""Please provide a concise, accurate summary of the following article in {max_length} words or less.
-Focus on the key points, main events, and important information. Write in a neutral, journalistic style.
+        logger.error("Invalid API response format")
+        return {
+            'summary': self._fallback_summary(text, max_length),
+            'method': 'fallback',
+            'error': 'Invalid API response'
+        }
 
-Article:
-{text}
+    def _prepare_article_text(self, text: str) -> str:
+        """Collapse whitespace and cap article length before it goes into a prompt"""
+        return _WS_RE.sub(' ', text).strip()[:MAX_PROMPT_CHARS]
 
-Summary:"""
+    def _create_summarization_prompt(self, text: str, max_length: int) -> str:
+        """Create a prompt for summarization"""
+        text = self._prepare_article_text(text)
+        return ''.join((_prompt_header(SUMMARY_PROMPT_HEADER, max_length), text, SUMMARY_PROMPT_SUFFIX))
 
-    def _make_api_request(self, prompt: str) -> Optional[Dict]:
-        """Make request to OpenRouter API"""
-        headers = {
+    def _build_headers(self) -> Dict:
+        """Headers for OpenRouter API requests"""
+        return {
             'Authorization': f'Bearer {self.api_key}',
             'Content-Type': 'application/json',
             'HTTP-Referer': 'https://newsfast.app',  # Replace with your actual domain
             'X-Title': 'NewsFast Article Summarizer'
         }
 
+    def _max_tokens(self, max_words: int) -> int:
+        """Completion token budget for an answer of up to `max_words` words (reasoning is disabled)"""
+        # Capping generation keeps slow providers from rambling past the requested length
+        return max(256, max_words * 2)
+
+    def _build_payload(self, prompt: str, max_tokens: int, response_format: Optional[Dict] = None) -> Dict:
+        """Request body for a chat completion"""
         data = {
             'model': self.default_model,
             'messages': [
@@ -107,20 +353,77 @@ Summary:"""
                     'content': prompt
                 }
             ],
-            'max_tokens': 3000,
+            'max_tokens': max_tokens,
             'temperature': 0.3,  # Lower temperature for more focused summaries
+            # The default model can reason before answering; its reasoning tokens
+            # would count against max_tokens, which is sized for the answer alone
+            'reasoning': {'enabled': False},
         }
+        if self.provider_sort:
+            data['provider'] = {'sort': self.provider_sort}
+        if response_format:
+            data['response_format'] = response_format
+        return data
+
+    def _make_api_request(self, prompt: str, max_tokens: int,
+                          response_format: Optional[Dict] = None) -> Optional[Dict]:
+        """Make request to OpenRouter API"""
+        cache_key = make_cache_key(self.default_model, prompt)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.api_base}/chat/completions",
-                headers=headers,
-                json=data,
+                data=orjson.dumps(self._build_payload(prompt, max_tokens, response_format)),
                 timeout=30
             )
 
             if response.status_code == 200:
-                return response.json()
+                result = orjson.loads(response.content)
+                if self._is_cacheable_response(result, response_format):
+                    self.cache.set(cache_key, result)
+                return result
+            else:
+                logger.error(f"API request failed: {response.status_code} - {response.text}")
+                return None
+
+        except Exception as e:
+            logger.error(f"API request error: {str(e)}")
+            return None
+
+    async def _a_make_api_request(self, prompt: str, max_tokens: int,
+                                  response_format: Optional[Dict] = None) -> Optional[Dict]:
+        """Make request to OpenRouter API without blocking the event loop"""
+        cache_key = make_cache_key(self.default_model, prompt)
+        cached = await self.cache.aget(cache_key)
+        if cached is not None:
+            return cached
+
+        body = orjson.dumps(self._build_payload(prompt, max_tokens, response_format))
+
+        try:
+            client, sem = _async_resources()
+            for attempt in range(_RETRY_TOTAL + 1):
+                async with sem:
+                    response = await client.post(
+                        f"{self.api_base}/chat/completions",
+                        headers=self._build_headers(),
+                        content=body
+                    )
+
+                if response.status_code not in _RETRY_STATUSES or attempt == _RETRY_TOTAL:
+                    break
+
+                # Back off without holding a concurrency slot
+                await asyncio.sleep(_RETRY_BACKOFF * (2 ** attempt))
+
+            if response.status_code == 200:
+                result = orjson.loads(response.content)
+                if self._is_cacheable_response(result, response_format):
+                    await self.cache.aset(cache_key, result)
+                return result
             else:
                 logger.error(f"API request failed: {response.status_code} - {response.text}")
                 return None
@@ -131,17 +434,14 @@ Summary:"""
 
     def _fallback_summary(self, text: str, max_length: int) -> str:
         """Generate a simple fallback summary when AI is not available"""
-        import re
+        # Extract first few sentences, without splitting the rest of the text
+        sentences = (match.group(0).strip() for match in _SENTENCE_RE.finditer(text))
+        summary_sentences = list(itertools.islice((s for s in sentences if s), 3))
 
-        # Extract first few sentences
-        sentences = re.split(r'[.!?]+', text.strip())
-        sentences = [s.strip() for s in sentences if s.strip()]
-
-        if not sentences:
+        if not summary_sentences:
             return "Unable to generate summary."
 
         # Take first 2-3 sentences and truncate if necessary
-        summary_sentences = sentences[:3]
         summary = '. '.join(summary_sentences) + '.'
 
         # Truncate to word limit
@@ -151,6 +451,136 @@ Summary:"""
 
         return summary
 
+    def analyze(self, text: str, max_length: int = 200, num_points: int = 5) -> Dict:
+        """
+        Generate a summary, title and key points with a single AI request
+
+        The article is only sent (and billed as prompt tokens) once, instead of
+        once per summarize/generate_title/extract_key_points call.
+
+        Args:
+            text (str): The article text
+            max_length (int): Maximum length of summary in words
+            num_points (int): Number of key points to extract
+
+        Returns:
+            Dict: Summary data, plus 'title' and 'key_points'
+        """
+        if self._is_short_text(text, max_length):
+            return self._fallback_analysis(self._skipped_summary(text))
+
+        if not self.api_key:
+            return self._fallback_analysis(self._missing_key_summary(text, max_length))
+
+        try:
+            prompt = self._create_analysis_prompt(text, max_length, num_points)
+            # Room for the summary, ~30 words per key point and the title
+            max_tokens = self._max_tokens(max_length + num_points * 30 + 10)
+            response = self._make_api_request(prompt, max_tokens, response_format={'type': 'json_object'})
+            return self._parse_analysis_response(response, text, max_length, num_points)
+
+        except Exception as e:
+            logger.error(f"Error in AI analysis: {str(e)}")
+            return self._fallback_analysis(self._error_summary(text, max_length, e))
+
+    async def a_analyze(self, text: str, max_length: int = 200, num_points: int = 5) -> Dict:
+        """Async version of analyze()"""
+        if self._is_short_text(text, max_length):
+            return self._fallback_analysis(self._skipped_summary(text))
+
+        if not self.api_key:
+            return self._fallback_analysis(self._missing_key_summary(text, max_length))
+
+        try:
+            prompt = self._create_analysis_prompt(text, max_length, num_points)
+            max_tokens = self._max_tokens(max_length + num_points * 30 + 10)
+            response = await self._a_make_api_request(prompt, max_tokens, response_format={'type': 'json_object'})
+            return self._parse_analysis_response(response, text, max_length, num_points)
+
+        except Exception as e:
+            logger.error(f"Error in AI analysis: {str(e)}")
+            return self._fallback_analysis(self._error_summary(text, max_length, e))
+
+    def _create_analysis_prompt(self, text: str, max_length: int, num_points: int) -> str:
+        """Create a prompt asking for summary, title and key points as JSON"""
+        text = self._prepare_article_text(text)
+        return ''.join((_prompt_header(ANALYSIS_PROMPT_HEADER, max_length, num_points), text, ANALYSIS_PROMPT_SUFFIX))
+
+    def _parse_analysis_response(self, response: Optional[Dict], text: str,
+                                 max_length: int, num_points: int) -> Dict:
+        """Turn a JSON analysis response into summary data with title and key points"""
+        result = self._parse_summary_response(response, text, max_length)
+        if result['method'] != 'ai_abstractive':
+            return self._fallback_analysis(result)
+
+        if self._is_truncated(response):
+            # Cut off at max_tokens, so the JSON and the summary in it are incomplete
+            logger.warning("AI analysis response was truncated")
+            return self._fallback_analysis(self._error_summary(text, max_length, ValueError('Truncated AI response')))
+
+        analysis = self._load_json_object(result['summary'])
+        if analysis is None:
+            # Model ignored the JSON instruction; its raw output is not shown as a summary
+            logger.warning("AI analysis response was not valid JSON")
+            return self._fallback_analysis(self._error_summary(text, max_length, ValueError('Invalid JSON in AI response')))
+
+        summary = analysis.get('summary')
+        if isinstance(summary, str) and summary.strip():
+            result['summary'] = summary.strip()
+        else:
+            result = self._error_summary(text, max_length, ValueError('Missing summary in AI response'))
+
+        title = analysis.get('title')
+        result['title'] = self._clean_title(title) if isinstance(title, str) and title.strip() else PLACEHOLDER_TITLE
+
+        key_points = analysis.get('key_points')
+        if isinstance(key_points, list):
+            result['key_points'] = [str(p).strip() for p in key_points if str(p).strip()][:num_points]
+        else:
+            result['key_points'] = []
+
+        return result
+
+    def _is_truncated(self, response: Dict) -> bool:
+        """True if generation stopped at the max_tokens limit"""
+        return response['choices'][0].get('finish_reason') == 'length'
+
+    def _is_cacheable_response(self, response: Dict, response_format: Optional[Dict] = None) -> bool:
+        """
+        True for a completion worth caching: it has content, was not cut off and,
+        if JSON was requested, contains a JSON object
+        """
+        choices = response.get('choices')
+        if not choices:
+            return False
+        content = (choices[0].get('message') or {}).get('content')
+        if not (content and content.strip()) or self._is_truncated(response):
+            return False
+        return not response_format or self._load_json_object(content) is not None
+
+    def _fallback_analysis(self, summary_data: Dict) -> Dict:
+        """Add default title and key points to summary data"""
+        summary_data['title'] = PLACEHOLDER_TITLE
+        summary_data['key_points'] = []
+        return summary_data
+
+    def _load_json_object(self, content: str) -> Optional[Dict]:
+        """Parse a JSON object from model output, tolerating surrounding text"""
+        candidates = [content]
+        match = _JSON_OBJECT_RE.search(content)
+        if match:
+            candidates.append(match.group(0))
+
+        for candidate in candidates:
+            try:
+                data = orjson.loads(candidate)
+            except ValueError:
+                continue
+            if isinstance(data, dict):
+                return data
+
+        return None
+
     def generate_title(self, text: str) -> str:
         """
         Generate a catchy title for the article using AI
@@ -162,30 +592,49 @@ Summary:"""
             str: Generated title
         """
         if not self.api_key:
-            return "Article Summary"
+            return PLACEHOLDER_TITLE
 
         try:
-            prompt = f"""Based on the following article, generate a concise, engaging title (10 words or less).
-Make it catchy and informative.
+            response = self._make_api_request(self._create_title_prompt(text), self._max_tokens(10))
+            return self._parse_title_response(response)
 
-Article:
-{text[:1000]}...  # First 1000 chars for context
+        except Exception as e:
+            logger.error(f"Error generating title: {str(e)}")
 
-Title:"""
+        return PLACEHOLDER_TITLE
 
-            response = self._make_api_request(prompt)
+    async def a_generate_title(self, text: str) -> str:
+        """Async version of generate_title()"""
+        if not self.api_key:
+            return PLACEHOLDER_TITLE
 
-            if response and 'choices' in response:
-                title = response['choices'][0]['message']['content'].strip()
-                # Clean up the title
-                title = re.sub(r'^["\']|["\']$', '', title)  # Remove quotes
-                title = re.sub(r'^Title:\s*', '', title)  # Remove "Title:" prefix
-                return title[:100]  # Limit length
+        try:
+            response = await self._a_make_api_request(self._create_title_prompt(text), self._max_tokens(10))
+            return self._parse_title_response(response)
 
         except Exception as e:
             logger.error(f"Error generating title: {str(e)}")
 
-        return "Article Summary"
+        return PLACEHOLDER_TITLE
+
+    def _create_title_prompt(self, text: str) -> str:
+        """Create a prompt for title generation"""
+        # The opening of the article is enough context for a title
+        text = self._prepare_article_text(text[:TITLE_CONTEXT_CHARS])
+        return ''.join((TITLE_PROMPT_HEADER, text, TITLE_PROMPT_SUFFIX))
+
+    def _parse_title_response(self, response: Optional[Dict]) -> str:
+        """Extract a cleaned-up title from an API response"""
+        if response and 'choices' in response:
+            return self._clean_title(response['choices'][0]['message']['content'])
+
+        return PLACEHOLDER_TITLE
+
+    def _clean_title(self, title: str) -> str:
+        """Strip quotes and a "Title:" prefix from a generated title"""
+        # Quotes may wrap the whole answer ("Title: ...") or just the title (Title: "...")
+        title = _TITLE_PREFIX_RE.sub('', title.strip(_TITLE_STRIP_CHARS), count=1)
+        return title.strip(_TITLE_STRIP_CHARS)[:100]  # Limit length
 
     def extract_key_points(self, text: str, num_points: int = 5) -> List[str]:
         """
@@ -202,49 +651,112 @@ Title:"""
             return ["AI key point extraction not available"]
 
         try:
-            prompt = f"""Extract {num_points} key points from the following article.
-Each point should be a single, clear sentence. Focus on the most important information.
-
-Article:
-{text}
-
-Key points (numbered):"""
-
-            response = self._make_api_request(prompt)
+            response = self._make_api_request(self._create_key_points_prompt(text, num_points),
+                                              self._max_tokens(num_points * 30))
+            key_points = self._parse_key_points_response(response, num_points)
+            if key_points is not None:
+                return key_points
 
-            if response and 'choices' in response:
-                content = response['choices'][0]['message']['content'].strip()
+        except Exception as e:
+            logger.error(f"Error extracting key points: {str(e)}")
 
-                # Parse the key points
-                lines = content.split('\n')
-                key_points = []
+        return ["AI key point extraction failed"]
 
-                for line in lines:
-                    line = line.strip()
-                    # Look for numbered points or bullet points
-                    if re.match(r'^\d+\.', line) or line.startswith('•') or line.startswith('-'):
-                        point = re.sub(r'^\d+\.|\s*•\s*|\s*-\s*', '', line).strip()
-                        if point:
-                            key_points.append(point)
+    async def a_extract_key_points(self, text: str, num_points: int = 5) -> List[str]:
+        """Async version of extract_key_points()"""
+        if not self.api_key:
+            return ["AI key point extraction not available"]
 
-                return key_points[:num_points]
+        try:
+            response = await self._a_make_api_request(self._create_key_points_prompt(text, num_points),
+                                                       self._max_tokens(num_points * 30))
+            key_points = self._parse_key_points_response(response, num_points)
+            if key_points is not None:
+                return key_points
 
         except Exception as e:
             logger.error(f"Error extracting key points: {str(e)}")
 
         return ["AI key point extraction failed"]
 
+    def _create_key_points_prompt(self, text: str, num_points: int) -> str:
+        """Create a prompt for key point extraction"""
+        text = self._prepare_article_text(text)
+        return ''.join((_prompt_header(KEY_POINTS_PROMPT_HEADER, num_points), text, KEY_POINTS_PROMPT_SUFFIX))
+
+    def _parse_key_points_response(self, response: Optional[Dict], num_points: int) -> Optional[List[str]]:
+        """Parse numbered or bulleted key points from an API response"""
+        if not (response and 'choices' in response):
+            return None
+
+        content = response['choices'][0]['message']['content'].strip()
+
+        # Parse the key points: keep numbered or bulleted lines, minus the marker
+        key_points = []
+
+        for line in content.splitlines():
+            match = _BULLET_RE.match(line)
+            if match:
+                key_points.append(match.group(1))
+
+        return key_points[:num_points]
+
+@functools.lru_cache(maxsize=1)
+def _get_summarizer() -> AISummarizer:
+    """Shared summarizer so the HTTP session and its pooled connections are reused"""
+    return AISummarizer()
+
+def warm_up() -> None:
+    """Create the shared summarizer up front so the first request does not pay for it"""
+    _get_summarizer()
+
+async def open_clients() -> None:
+    """Create the shared async client in the running event loop (e.g. on app startup)"""
+    _async_resources()
+
+async def aclose_clients() -> None:
+    """Close the shared HTTP clients and their pooled connections"""
+    global _async_client, _OPENROUTER_SEM, _clients_loop
+    if _async_client is not None and _clients_loop is asyncio.get_running_loop():
+        await _async_client.aclose()
+    _async_client = _OPENROUTER_SEM = _clients_loop = None
+
+    if _get_summarizer.cache_info().currsize:
+        _get_summarizer().session.close()
+
 def ai_summarize(text: str, max_length: int = 200) -> Dict:
     """Convenience function for AI summarization"""
-    summarizer = AISummarizer()
-    return summarizer.summarize(text, max_length)
+    return _get_summarizer().summarize(text, max_length)
+
+def ai_analyze(text: str, max_length: int = 200, num_points: int = 5) -> Dict:
+    """Convenience function for combined AI summary, title and key points"""
+    return _get_summarizer().analyze(text, max_length, num_points)
 
 def generate_ai_title(text: str) -> str:
     """Convenience function for AI title generation"""
-    summarizer = AISummarizer()
-    return summarizer.generate_title(text)
+    return _get_summarizer().generate_title(text)
 
 def extract_ai_key_points(text: str, num_points: int = 5) -> List[str]:
     """Convenience function for AI key point extraction"""
-    summarizer = AISummarizer()
-    return summarizer.extract_key_points(text, num_points)
\ No newline at end of file
+    return _get_summarizer().extract_key_points(text, num_points)
+
+async def ai_summarize_async(text: str, max_length: int = 200) -> Dict:
+    """Convenience function for async AI summarization"""
+    return await _get_summarizer().a_summarize(text, max_length)
+
+async def ai_analyze_async(text: str, max_length: int = 200, num_points: int = 5) -> Dict:
+    """Convenience function for async combined AI summary, title and key points"""
+    return await _get_summarizer().a_analyze(text, max_length, num_points)
+
+async def stream_ai_summary(text: str, max_length: int = 200) -> AsyncIterator[str]:
+    """Convenience function for streaming AI summarization"""
+    async for chunk in _get_summarizer().stream_summarize(text, max_length):
+        yield chunk
+
+async def generate_ai_title_async(text: str) -> str:
+    """Convenience function for async AI title generation"""
+    return await _get_summarizer().a_generate_title(text)
+
+async def extract_ai_key_points_async(text: str, num_points: int = 5) -> List[str]:
+    """Convenience function for async AI key point extraction"""
+    return await _get_summarizer().a_extract_key_points(text, num_points)
\ No newline at end of file
@@ -0,0 +1,116 @@
+"""
+Response cache for LLM API calls
+"""
+
+import os
+import json
+import asyncio
+import hashlib
+import logging
+import functools
+import threading
+from typing import Optional, Dict, Protocol
+from cachetools import TTLCache
+
+try:
+    import redis
+except ImportError:  # Redis is optional; the in-process cache is used without it
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# Cached responses expire after 4 hours
+DEFAULT_TTL = 4 * 60 * 60
+
+# Redis calls give up after this many seconds, so an outage costs a cache miss
+REDIS_TIMEOUT = 1
+
+class CacheBackend(Protocol):
+    """Interface shared by the cache backends; async code uses aget/aset"""
+
+    def get(self, key: str) -> Optional[Dict]:
+        ...
+
+    def set(self, key: str, value: Dict) -> None:
+        ...
+
+    async def aget(self, key: str) -> Optional[Dict]:
+        ...
+
+    async def aset(self, key: str, value: Dict) -> None:
+        ...
+
+class MemoryCache:
+    """In-process LRU cache with a time-to-live per entry"""
+
+    def __init__(self, maxsize: int = 1024, ttl: int = DEFAULT_TTL):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        # TTLCache is not thread-safe and the sync API runs in worker threads
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            return self._cache.get(key)
+
+    def set(self, key: str, value: Dict) -> None:
+        with self._lock:
+            self._cache[key] = value
+
+    # In-memory lookups do not block, so the async API calls straight through
+    async def aget(self, key: str) -> Optional[Dict]:
+        return self.get(key)
+
+    async def aset(self, key: str, value: Dict) -> None:
+        self.set(key, value)
+
+class RedisCache:
+    """Redis-backed cache, shared between worker processes"""
+
+    def __init__(self, url: str, ttl: int = DEFAULT_TTL, prefix: str = 'newsfast:llm:'):
+        self._client = redis.Redis.from_url(url, socket_timeout=REDIS_TIMEOUT,
+                                            socket_connect_timeout=REDIS_TIMEOUT)
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[Dict]:
+        try:
+            raw = self._client.get(self.prefix + key)
+            return json.loads(raw) if raw else None
+        except (redis.RedisError, ValueError) as e:
+            # An outage or a corrupt entry is a cache miss
+            logger.warning(f"LLM cache read failed: {str(e)}")
+            return None
+
+    def set(self, key: str, value: Dict) -> None:
+        try:
+            self._client.setex(self.prefix + key, self.ttl, json.dumps(value))
+        except redis.RedisError as e:
+            logger.warning(f"LLM cache write failed: {str(e)}")
+
+    # Each call is a network round-trip, so async callers run it in a worker
+    # thread rather than blocking the event loop
+    async def aget(self, key: str) -> Optional[Dict]:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: Dict) -> None:
+        await asyncio.to_thread(self.set, key, value)
+
+def make_cache_key(model: str, prompt: str) -> str:
+    """Cache key for a completion of `prompt` by `model`"""
+    return hashlib.sha256(f"{model}|{prompt}".encode('utf-8')).hexdigest()
+
+@functools.lru_cache(maxsize=1)
+def get_cache() -> CacheBackend:
+    """
+    Return the shared LLM response cache
+
+    Uses Redis when LLM_CACHE_URL is set (e.g. redis://localhost:6379/0),
+    otherwise an in-process memory cache.
+    """
+    url = os.getenv('LLM_CACHE_URL')
+    if url:
+        if redis is not None:
+            return RedisCache(url)
+        logger.warning("LLM_CACHE_URL is set but the redis package is not installed; using memory cache")
+
+    return MemoryCache()
@@ -1,15 +1,28 @@
-from fastapi import FastAPI, Request, HTTPException
+from fastapi import FastAPI, Request, Response, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 import uvicorn
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator, Tuple
 import os
+import json
+import orjson
+import asyncio
+import hashlib
 import logging
-from scraper import scrape_url
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from cachetools import TTLCache
+from dotenv import load_dotenv
+
+# Load environment variables once, before the app modules read them
+load_dotenv()
+
+from scraper import scrape_url_async
 from summarizer import extractive_summarize, extract_keywords
-from ai_summarizer import ai_summarize, generate_ai_title
+import ai_summarizer
+from ai_summarizer import ai_analyze_async, stream_ai_summary, PLACEHOLDER_TITLE
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -23,6 +36,11 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 # Templates
 templates = Jinja2Templates(directory="templates")
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Successful /summarize responses by normalized URL, so repeat requests skip the pipeline
+_RESPONSE_CACHE = TTLCache(maxsize=2048, ttl=3600)
+
 class URLRequest(BaseModel):
     url: str
 
@@ -34,59 +52,73 @@ class SummarizationResponse(BaseModel):
     success: bool
     error: Optional[str] = None
 
+@app.on_event("startup")
+async def configure_executor():
+    """Bound the worker threads used for scraping and extractive summarization"""
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=16))
+
+@app.on_event("startup")
+async def warm_up():
+    """Set up shared clients in the server's event loop before the first request arrives"""
+    ai_summarizer.warm_up()
+    await ai_summarizer.open_clients()
+
+@app.on_event("shutdown")
+async def close_clients():
+    """Close pooled HTTP connections"""
+    await ai_summarizer.aclose_clients()
+
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
 
 @app.post("/summarize", response_model=SummarizationResponse)
-async def summarize_article(request: URLRequest):
+async def summarize_article(request: URLRequest, http_request: Request, response: Response):
     """
     Summarize an article from a given URL
-    """
-    try:
-        logger.info(f"Starting summarization for URL: {request.url}")
 
-        # Step 1: Scrape the article
-        article_data = scrape_url(request.url)
-
-        # Step 2: Generate extractive summary
-        extractive_result = extractive_summarize(article_data['text'], num_sentences=5)
+    Clients sending "Accept: application/x-ndjson" get newline-delimited JSON
+    instead, with each part of the result sent as soon as it is ready.
+    """
+    cache_key = _response_cache_key(request.url)
+    cached = _RESPONSE_CACHE.get(cache_key)
+    cache_status = "HIT" if cached is not None else "MISS"
 
-        # Step 3: Extract keywords
-        keywords_result = extract_keywords(article_data['text'], num_keywords=10)
+    if NDJSON_MEDIA_TYPE in http_request.headers.get("accept", ""):
+        return StreamingResponse(
+            _summarize_ndjson(request.url, cache_key, cached),
+            media_type=NDJSON_MEDIA_TYPE,
+            headers={"X-Cache": cache_status}
+        )
 
-        # Step 4: Generate AI summary (abstractive)
-        ai_result = ai_summarize(article_data['text'], max_length=150)
+    response.headers["X-Cache"] = cache_status
+    if cached is not None:
+        return cached
 
-        # Step 5: Generate AI title if original title is not good
-        if len(article_data['title'].strip()) < 10:
-            article_data['title'] = generate_ai_title(article_data['text'])
+    try:
+        results = {}
+        async for stage, data in _summarize_stages(request.url):
+            results[stage] = data
 
         # Prepare response
         response_data = SummarizationResponse(
-            article=article_data,
-            extractive_summary=extractive_result,
-            keywords=keywords_result,
-            ai_summary=ai_result,
+            article=results['article'],
+            extractive_summary=results['extractive_summary'],
+            keywords=results['keywords'],
+            ai_summary=results['ai_summary'],
             success=True
         )
 
+        if _is_cacheable(response_data.ai_summary):
+            _RESPONSE_CACHE[cache_key] = response_data
+
         logger.info("Summarization completed successfully")
         return response_data
 
     except Exception as e:
         logger.error(f"Error in summarization: {str(e)}")
 
-        # Provide more helpful error messages based on error type
-        error_message = str(e)
-        if "403" in error_message or "forbidden" in error_message.lower():
-            error_message = "This content is behind a paywall or requires authentication. Try a different article or news source."
-        elif "404" in error_message:
-            error_message = "Article not found. Please check the URL and try again."
-        elif "Could not extract valid article content" in error_message:
-            error_message = "Unable to extract article content. This site may have anti-scraping protection or an unusual format."
-        else:
-            error_message = "An error occurred while processing the article. Please try again or use a different URL."
+        error_message = _friendly_error_message(e)
 
         # Return error response
         return SummarizationResponse(
@@ -98,6 +130,127 @@ async def summarize_article(request: URLRequest):
             error=error_message
         )
 
+async def _summarize_stages(url: str) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Run the summarization pipeline, yielding (stage, data) pairs as each part
+    finishes. Stages are 'article', 'extractive_summary', 'keywords' and
+    'ai_summary'; 'article' is sent again if the AI title replaces the original.
+    """
+    logger.info(f"Starting summarization for URL: {url}")
+
+    # Step 1: Scrape the article (blocking I/O, so keep it off the event loop)
+    article_data = await scrape_url_async(url)
+    yield 'article', article_data
+
+    text = article_data['text']
+    needs_title = len(article_data['title'].strip()) < 10
+
+    async def run_stage(stage, awaitable):
+        return stage, await awaitable
+
+    # Steps 2-4 are independent: run the extractive summary and keywords
+    # in worker threads while the AI request is in flight
+    stages = [
+        run_stage('extractive_summary', asyncio.to_thread(extractive_summarize, text, num_sentences=5)),
+        run_stage('keywords', asyncio.to_thread(extract_keywords, text, num_keywords=10)),
+        # One AI request returns the summary, a title and key points
+        run_stage('ai_summary', ai_analyze_async(text, max_length=150, num_points=5)),
+    ]
+    for next_stage in asyncio.as_completed(stages):
+        stage, data = await next_stage
+        yield stage, data
+
+        # Step 5: Use the AI title if original title is not good and the AI gave a real one
+        if stage == 'ai_summary' and needs_title and _is_usable_ai_title(data):
+            article_data['title'] = data['title']
+            yield 'article', article_data
+
+async def _summarize_ndjson(url: str, cache_key: str,
+                            cached: Optional[SummarizationResponse]) -> AsyncIterator[bytes]:
+    """Serve the summarization pipeline as NDJSON lines of {"stage": ..., "data": ...}"""
+    if cached is not None:
+        for stage in ('article', 'extractive_summary', 'keywords', 'ai_summary'):
+            yield _ndjson_line({"stage": stage, "data": getattr(cached, stage)})
+        yield _ndjson_line({"stage": "done", "success": True})
+        return
+
+    results = {}
+    try:
+        async for stage, data in _summarize_stages(url):
+            results[stage] = data
+            yield _ndjson_line({"stage": stage, "data": data})
+
+    except Exception as e:
+        logger.error(f"Error in summarization: {str(e)}")
+        yield _ndjson_line({"stage": "error", "success": False, "error": _friendly_error_message(e)})
+        return
+
+    if _is_cacheable(results.get('ai_summary')):
+        _RESPONSE_CACHE[cache_key] = SummarizationResponse(success=True, **results)
+    logger.info("Summarization completed successfully")
+    yield _ndjson_line({"stage": "done", "success": True})
+
+def _ndjson_line(payload: Dict[str, Any]) -> bytes:
+    """Encode one NDJSON line; scores may be numpy scalars and keyed by sentence index"""
+    return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) + b"\n"
+
+@app.post("/summarize/stream")
+async def summarize_article_stream(request: URLRequest):
+    """
+    Stream the AI summary of an article as server-sent events
+
+    Each event carries a JSON object: {"delta": "..."} for summary text,
+    {"error": "..."} on failure, and a final "done" event.
+    """
+    async def event_stream():
+        try:
+            logger.info(f"Starting streaming summarization for URL: {request.url}")
+            article_data = await scrape_url_async(request.url)
+
+            async for chunk in stream_ai_summary(article_data['text'], max_length=150):
+                yield f"data: {json.dumps({'delta': chunk})}\n\n"
+
+        except Exception as e:
+            logger.error(f"Error in streaming summarization: {str(e)}")
+            yield f"event: error\ndata: {json.dumps({'error': _friendly_error_message(e)})}\n\n"
+
+        yield "event: done\ndata: {}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+def _is_usable_ai_title(ai_summary: Dict[str, Any]) -> bool:
+    """True if the AI stage produced a real title, rather than a fallback or the placeholder"""
+    title = (ai_summary.get('title') or '').strip()
+    return ai_summary.get('method') != 'fallback' and bool(title) and title != PLACEHOLDER_TITLE
+
+def _is_cacheable(ai_summary: Optional[Dict[str, Any]]) -> bool:
+    """
+    True if a response with this AI result may be cached
+
+    Fallback summaries (missing key, API errors, rate limits) are not cached,
+    so one failed upstream call does not degrade a URL for the cache's lifetime.
+    """
+    return bool(ai_summary) and 'error' not in ai_summary and ai_summary.get('method') != 'fallback'
+
+def _response_cache_key(url: str) -> str:
+    """Cache key for a URL; scheme and host are case-insensitive and fragments are ignored"""
+    parts = urlsplit(url.strip())
+    normalized = parts._replace(scheme=parts.scheme.lower(), netloc=parts.netloc.lower(), fragment='').geturl()
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+def _friendly_error_message(error: Exception) -> str:
+    """Map a processing error to a message suitable for users"""
+    # Provide more helpful error messages based on error type
+    error_message = str(error)
+    if "403" in error_message or "forbidden" in error_message.lower():
+        return "This content is behind a paywall or requires authentication. Try a different article or news source."
+    elif "404" in error_message:
+        return "Article not found. Please check the URL and try again."
+    elif "Could not extract valid article content" in error_message:
+        return "Unable to extract article content. This site may have anti-scraping protection or an unusual format."
+    else:
+        return "An error occurred while processing the article. Please try again or use a different URL."
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
@@ -105,4 +258,13 @@ async def health_check():
 
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="127.0.0.1", port=port)
\ No newline at end of file
+    # One event loop per worker process; loop/http "auto" use uvloop and
+    # httptools, which uvicorn[standard] installs where they are supported
+    uvicorn.run(
+        "main:app",
+        host=os.getenv("HOST", "127.0.0.1"),
+        port=port,
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        loop="auto",
+        http="auto"
+    )
\ No newline at end of file
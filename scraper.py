@@ -2,29 +2,519 @@
 Web scraper module for extracting article content from URLs
 """
 
+import os
+import asyncio
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from lxml import html as lxml_html
+import aiohttp
+from selectolax.lexbor import LexborHTMLParser
 import newspaper
 from newspaper import Article
 import re
 import json
 import time
-from typing import Dict, Optional, Tuple
+import functools
+import threading
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
 from urllib.parse import urlparse
+from cachetools import TTLCache
 import logging
 
+try:
+    import diskcache
+except ImportError:  # The on-disk HTML cache is optional
+    diskcache = None
+
+try:
+    import brotli
+except ImportError:  # Without a Brotli decoder only gzip/deflate are requested
+    brotli = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    # Compressed HTML is several times smaller on the wire; requests and aiohttp decode it
+    'Accept-Encoding': 'br, gzip, deflate' if brotli is not None else 'gzip, deflate'
+}
+
+# Alternative browser identities tried when a site refuses the default one
+FALLBACK_HEADERS = [
+    {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    },
+    {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    },
+    {
+        'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    }
+]
+
+# Retry policy for rate-limited or failing sites in the async batch scraper
+_FETCH_RETRIES = 3
+_FETCH_BACKOFF = 0.5
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_WS_RE = re.compile(r'\s+')
+
+# Text between sentence terminators
+_SENTENCE_RE = re.compile(r'[^.!?]+')
+
+# Number of leading sentences used as the fallback summary
+SUMMARY_SENTENCES = 3
+
+# Class names of containers that may hold the main paper content
+_SECTION_RE = re.compile(r'(content|paper|article|main|body)', re.I)
+
+_DATE_RES = [
+    re.compile(r'\d{4}-\d{2}-\d{2}'),  # YYYY-MM-DD
+    re.compile(r'\d{2}/\d{2}/\d{4}'),  # MM/DD/YYYY
+    re.compile(r'\d{1,2}\s+\w+\s+\d{4}'),  # DD Month YYYY
+]
+
+# Class/id words marking navigation, headers, sidebars and other page chrome.
+# Attributes are split on whitespace, '-' and '_', so "main-nav" matches "nav".
+_SKIP_TOKENS = frozenset({
+    'nav', 'navbar', 'navigation', 'header', 'footer', 'sidebar', 'menu',
+    'breadcrumb', 'breadcrumbs', 'social', 'share', 'comment', 'comments'
+})
+_ATTR_TOKEN_RE = re.compile(r'[\s_-]+')
+
+# Elements whose text is collected as article content
+_TEXT_TAGS = frozenset({'p', 'div', 'section', 'article'})
+
+# Academic/research site specific content selectors, by domain
+ACADEMIC_CONTENT_SELECTORS = {
+    'dl.acm.org': [
+        '.abstract', '.abstractSection', '.article__abstract',
+        '.article-content', '.content', '.main-content',
+        '.paper-abstract', '.paper-content', '.full-text',
+        '.section-content', '.article-body', '.paper-body',
+        '.article-section', '.paper-section'
+    ],
+    'arxiv.org': [
+        '.abstract', '.content', '.paper-content',
+        '.article-content', '.main-content', '.abstract-text'
+    ],
+    'ieee.org': [
+        '.abstract', '.article-content', '.paper-content',
+        '.full-text', '.article-body', '.abstract-text'
+    ],
+    'springer.com': [
+        '.abstract', '.main-content', '.article-content',
+        '.content', '.paper-content', '.abstract-text'
+    ],
+    'sciencedirect.com': [
+        '.abstract', '.article-content', '.paper-content',
+        '.full-text', '.article-body', '.abstract-text'
+    ],
+    'researchgate.net': [
+        '.abstract', '.content', '.paper-content',
+        '.article-content', '.abstract-text'
+    ],
+    'academia.edu': [
+        '.abstract', '.content', '.paper-content',
+        '.article-content', '.abstract-text'
+    ]
+}
+
+# Content selectors tried on every site
+GENERAL_CONTENT_SELECTORS = (
+    'article',
+    '[role="main"]',
+    '.content',
+    '.post-content',
+    '.entry-content',
+    '.article-content',
+    '.story-body',
+    'main',
+    '#content',
+    '#main',
+    '.post',
+    '.entry',
+    '.paper-content',
+    '.abstract',
+    '.article-body',
+    '.full-text',
+    '.main-content',
+    '.abstract-text',
+    '.paper-abstract',
+    '.research-paper',
+    '.academic-content'
+)
+
+# Academic/research site specific title selectors, by domain
+ACADEMIC_TITLE_SELECTORS = {
+    'dl.acm.org': [
+        'h1', '.paper-title', '.article-title', '.citation__title',
+        '.publication-title', '.paper-header-title'
+    ],
+    'arxiv.org': [
+        'h1', '.title', '.paper-title', '.article-title'
+    ],
+    'ieee.org': [
+        'h1', '.paper-title', '.article-title', '.title'
+    ],
+    'springer.com': [
+        'h1', '.article-title', '.paper-title', '.title'
+    ],
+    'sciencedirect.com': [
+        'h1', '.article-title', '.paper-title', '.title'
+    ]
+}
+
+# Title selectors tried on every site
+GENERAL_TITLE_SELECTORS = (
+    'title',
+    'h1',
+    '.headline',
+    '.article-title',
+    '.entry-title',
+    '.post-title',
+    '[property="og:title"]',
+    'meta[property="og:title"]',
+    '.paper-title',
+    '.publication-title',
+    '.citation-title'
+)
+
+# Most authors reported for one article
+MAX_AUTHORS = 10
+
+META_AUTHOR_SELECTORS = (
+    'meta[name="author"]',
+    'meta[property="article:author"]',
+    'meta[property="author"]'
+)
+
+# Academic/research site specific author selectors, by domain
+ACADEMIC_AUTHOR_SELECTORS = {
+    'dl.acm.org': [
+        '.author', '.authors', '.citation-authors', '.paper-authors',
+        '.author-list', '.contributor-list', '.byline'
+    ],
+    'arxiv.org': [
+        '.authors', '.author', '.paper-authors', '.byline'
+    ],
+    'ieee.org': [
+        '.authors', '.author', '.paper-authors', '.byline'
+    ],
+    'springer.com': [
+        '.authors', '.author', '.paper-authors', '.byline'
+    ],
+    'sciencedirect.com': [
+        '.authors', '.author', '.paper-authors', '.byline'
+    ]
+}
+
+# Author selectors tried on every site
+GENERAL_AUTHOR_SELECTORS = (
+    '.author',
+    '.authors',
+    '.byline',
+    '[rel="author"]',
+    '.entry-author',
+    '.post-author',
+    '[property="author"]',
+    '[property="article:author"]',
+    '.citation-authors',
+    '.paper-authors',
+    '.contributor-list'
+)
+
+def _selector_table(site_selectors: Dict[str, List[str]], general: Tuple[str, ...]) -> Dict[str, Tuple[str, ...]]:
+    """
+    Selectors to try for each site, site-specific first then the general
+    ones, without repeats. The '' entry holds the general selectors alone.
+    """
+    table = {site: tuple(dict.fromkeys(selectors + list(general))) for site, selectors in site_selectors.items()}
+    table[''] = tuple(dict.fromkeys(general))
+    return table
+
+def _match_site(domain: str, site_selectors: Dict[str, List[str]]) -> str:
+    """
+    The site in site_selectors that domain is, or is a subdomain of, or ''
+
+    Suffixes of the host are looked up longest first (ieeexplore.ieee.org,
+    then ieee.org), so each check is a dict lookup rather than a scan.
+    """
+    labels = domain.lower().split(':', 1)[0].split('.')
+    for i in range(len(labels)):
+        suffix = '.'.join(labels[i:])
+        if suffix in site_selectors:
+            return suffix
+    return ''
+
+_CONTENT_SELECTOR_TABLE = _selector_table(ACADEMIC_CONTENT_SELECTORS, GENERAL_CONTENT_SELECTORS)
+_TITLE_SELECTOR_TABLE = _selector_table(ACADEMIC_TITLE_SELECTORS, GENERAL_TITLE_SELECTORS)
+_AUTHOR_SELECTOR_TABLE = _selector_table(ACADEMIC_AUTHOR_SELECTORS, GENERAL_AUTHOR_SELECTORS)
+
+class SiteSelectors(NamedTuple):
+    """
+    Content, title and author selectors for one domain, each joined into one
+    comma-separated query. Lexbor returns the matches of such a query grouped
+    by selector in the order listed, so candidates still come in priority order.
+    """
+    content: str
+    title: str
+    authors: str
+
+@functools.lru_cache(maxsize=256)
+def _selectors_for(domain: str) -> SiteSelectors:
+    """Selectors for a domain; resolved once per domain"""
+    content_site = _match_site(domain, ACADEMIC_CONTENT_SELECTORS)
+    if content_site:
+        logger.info(f"Using academic selectors for {content_site}")
+
+    title_selectors = _TITLE_SELECTOR_TABLE[_match_site(domain, ACADEMIC_TITLE_SELECTORS)]
+    return SiteSelectors(
+        content=', '.join(_CONTENT_SELECTOR_TABLE[content_site]),
+        # Meta tags have no text; their content attribute is checked separately
+        title=', '.join(sel for sel in title_selectors if not sel.startswith('meta')),
+        authors=', '.join(_AUTHOR_SELECTOR_TABLE[_match_site(domain, ACADEMIC_AUTHOR_SELECTORS)])
+    )
+
+# Download chunk size when streaming pages
+STREAM_CHUNK_SIZE = 16384
+
+def _read_body(response: requests.Response) -> Tuple[bytes, bool]:
+    """
+    Read a streamed response to the end
+
+    The whole body is read, so every parser sees the complete page and the
+    connection goes back to the session's pool for reuse. If the connection
+    drops part way, what arrived is still returned for parsing.
+
+    Args:
+        response (requests.Response): A response requested with stream=True
+
+    Returns:
+        Tuple[bytes, bool]: The page HTML, and whether it was read to EOF (only
+            complete pages may be cached)
+    """
+    html = bytearray()
+    try:
+        for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+            html.extend(chunk)
+    except (requests.exceptions.ChunkedEncodingError, requests.exceptions.ConnectionError) as e:
+        if not html:
+            raise
+        logger.warning(f"Download of {response.url} cut off after {len(html)} bytes: {str(e)}")
+        return bytes(html), False
+
+    return bytes(html), True
+
+# Downloaded pages younger than this are reused from the on-disk cache without
+# a request; older ones are revalidated with If-None-Match/If-Modified-Since
+HTML_CACHE_FRESH_SECONDS = 6 * 60 * 60
+# Entries that have not been refreshed for a week are dropped
+HTML_CACHE_EXPIRE_SECONDS = 7 * 24 * 60 * 60
+
+def _open_html_cache():
+    """
+    Open the on-disk HTML cache, if NEWSFAST_CACHE_DIR is set
+
+    Returns:
+        diskcache.Cache or None when the cache is disabled
+    """
+    directory = os.getenv('NEWSFAST_CACHE_DIR')
+    if not directory:
+        return None
+    if diskcache is None:
+        logger.warning("NEWSFAST_CACHE_DIR is set but the diskcache package is not installed; HTML caching disabled")
+        return None
+    return diskcache.Cache(directory)
+
+def _url_cache_key(url: str) -> str:
+    """Cache key for a URL; the fragment never reaches the server"""
+    return urlparse(url)._replace(fragment='').geturl()
+
+# Blocking scrapes started from async code run here, off the event loop; the
+# pool size caps the scrapes in flight, so remote sites are not flooded
+SCRAPE_MAX_CONCURRENCY = int(os.getenv('SCRAPE_MAX_CONCURRENCY', '32'))
+_SCRAPE_EXECUTOR = ThreadPoolExecutor(max_workers=SCRAPE_MAX_CONCURRENCY, thread_name_prefix='article-scrape')
+
+# Number of scraped articles kept in memory, by URL, and for how long; no
+# longer than HTML_CACHE_FRESH_SECONDS, so updated articles are revalidated
+ARTICLE_CACHE_SIZE = 1024
+ARTICLE_CACHE_TTL = 60 * 60
+
+# Resolved addresses are reused by the scraper's session, like the aiohttp
+# connector's ttl_dns_cache. getaddrinfo does not report record TTLs, so
+# entries are kept for a fixed time instead; 0 turns the cache off.
+SCRAPE_DNS_CACHE_TTL = int(os.getenv('SCRAPE_DNS_CACHE_TTL', '300'))
+_DNS_CACHE = TTLCache(maxsize=1024, ttl=SCRAPE_DNS_CACHE_TTL) if SCRAPE_DNS_CACHE_TTL > 0 else None
+_DNS_CACHE_LOCK = threading.Lock()
+
+def _cached_getaddrinfo(host: str, port: int) -> List[str]:
+    """Addresses of a host, looked up with socket.getaddrinfo at most once per TTL"""
+    key = (host, port)
+    with _DNS_CACHE_LOCK:
+        addresses = _DNS_CACHE.get(key)
+    if addresses is not None:
+        return addresses
+
+    infos = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+    # Keep the resolver's order, which is the order connections are tried in
+    addresses = list(dict.fromkeys(info[4][0] for info in infos))
+    with _DNS_CACHE_LOCK:
+        _DNS_CACHE[key] = addresses
+    return addresses
+
+class _CachedDNSConnectionMixin:
+    """
+    urllib3 connection that connects to its host's cached addresses
+
+    Only connections of the scraper's session use it; DNS for the rest of the
+    process is left alone.
+    """
+
+    def _new_conn(self):
+        host = self._dns_host
+        if _DNS_CACHE is None:
+            return super()._new_conn()
+
+        try:
+            addresses = _cached_getaddrinfo(host, self.port)
+        except OSError:
+            # Let urllib3 resolve the host itself and report the failure
+            return super()._new_conn()
+
+        # urllib3 connects to _dns_host; the TLS server name and Host header
+        # are set after this, from the original host
+        error = None
+        for address in addresses:
+            self._dns_host = address
+            try:
+                return super()._new_conn()
+            except (NewConnectionError, ConnectTimeoutError) as e:
+                error = e
+            finally:
+                self._dns_host = host
+        raise error
+
+class _CachedDNSHTTPConnection(_CachedDNSConnectionMixin, HTTPConnection):
+    pass
+
+class _CachedDNSHTTPSConnection(_CachedDNSConnectionMixin, HTTPSConnection):
+    pass
+
+class _CachedDNSHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CachedDNSHTTPConnection
+
+class _CachedDNSHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CachedDNSHTTPSConnection
+
+class _CachedDNSAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections resolve hosts through the scraper's DNS cache"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _CachedDNSHTTPConnectionPool,
+            'https': _CachedDNSHTTPSConnectionPool
+        }
+
+def _read_json_ld(tree: LexborHTMLParser) -> List[Dict]:
+    """Objects from the page's JSON-LD blocks, with @graph entries flattened"""
+    items = []
+    for script in tree.css('script[type="application/ld+json"]'):
+        try:
+            data = json.loads(script.text())
+        except ValueError:
+            continue
+
+        pending = data if isinstance(data, list) else [data]
+        while pending:
+            item = pending.pop(0)
+            if isinstance(item, dict):
+                items.append(item)
+                graph = item.get('@graph')
+                if isinstance(graph, list):
+                    pending.extend(graph)
+
+    return items
+
+# Charset declared in a Content-Type header or <meta> tag
+_HEADER_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.I)
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w.:-]+)', re.I)
+# Browsers only look for a <meta> charset near the start of the document
+CHARSET_SNIFF_BYTES = 2048
+
+def _header_charset(content_type: Optional[str]) -> Optional[str]:
+    """Charset parameter of a Content-Type header, if any"""
+    match = _HEADER_CHARSET_RE.search(content_type) if content_type else None
+    return match.group(1) if match else None
+
+def _decode_html(html: bytes, charset: Optional[str] = None) -> str:
+    """
+    Decode a downloaded page once, for all parsers
+
+    Uses the HTTP header charset, then a <meta> charset declaration, then UTF-8,
+    instead of leaving each parser to run its own encoding detection.
+
+    Args:
+        html (bytes): The page HTML
+        charset (Optional[str]): Charset from the response's Content-Type header
+
+    Returns:
+        str: The decoded HTML
+    """
+    if not charset:
+        match = _META_CHARSET_RE.search(html, 0, CHARSET_SNIFF_BYTES)
+        charset = match.group(1).decode('ascii') if match else 'utf-8'
+
+    try:
+        return html.decode(charset, errors='replace')
+    except LookupError:
+        logger.warning(f"Unknown charset {charset}, decoding as UTF-8")
+        return html.decode('utf-8', errors='replace')
+
+def _count_words(text: str) -> int:
+    """Number of whitespace-separated words"""
+    # str.split() runs in C; counting regex matches in Python is several times slower
+    return len(text.split())
+
+def _parse(html) -> LexborHTMLParser:
+    """
+    Parse HTML with selectolax's Lexbor backend
+
+    Markup Lexbor refuses is normalized by lxml first and parsed again.
+    """
+    try:
+        return LexborHTMLParser(html)
+    except Exception as e:
+        logger.warning(f"Lexbor parsing failed, normalizing with lxml: {str(e)}")
+        return LexborHTMLParser(lxml_html.tostring(lxml_html.document_fromstring(html)))
+
 class ArticleScraper:
     """Main scraper class for extracting article content from URLs"""
 
     def __init__(self):
         self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        self.session.headers.update(DEFAULT_HEADERS)
+        # Keep connections alive so repeat visits to a site skip the TCP/TLS handshake,
+        # and new connections skip the DNS lookup
+        adapter = _CachedDNSAdapter(pool_connections=32, pool_maxsize=64)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Recently scraped articles by URL; TTLCache is not thread-safe and the
+        # scraper is shared between threads
+        self._cache = TTLCache(maxsize=ARTICLE_CACHE_SIZE, ttl=ARTICLE_CACHE_TTL)
+        self._cache_lock = threading.Lock()
+
+        # Raw HTML by URL, kept across restarts (optional)
+        self._html_cache = _open_html_cache()
 
     def scrape_article(self, url: str) -> Dict:
         """
@@ -36,350 +526,335 @@ class ArticleScraper:
         Returns:
             Dict: Article data with title, text, meta information
         """
+        cache_key = _url_cache_key(url)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"Returning cached article for: {url}")
+            return cached
+
         try:
             logger.info(f"Starting to scrape article from: {url}")
 
-            # First try with newspaper3k library
-            article_data = self._scrape_with_newspaper(url)
-            if article_data and self._validate_article(article_data):
-                logger.info("Successfully scraped with newspaper3k")
-                return article_data
-
-            # Fallback to custom scraping
-            logger.info("Falling back to custom scraping")
-            article_data = self._scrape_custom(url)
-            if article_data and self._validate_article(article_data):
-                logger.info("Successfully scraped with custom method")
-                return article_data
-
-            # Last resort: basic HTML parsing
-            logger.info("Using basic HTML parsing as last resort")
-            article_data = self._scrape_basic(url)
-            if article_data and self._validate_article(article_data):
-                logger.info("Successfully scraped with basic method")
-                return article_data
-
-            raise ValueError("Could not extract valid article content")
+            # Download once; all parsers work on the same HTML
+            html, custom_method = self._fetch_html(url)
+            article_data = self.parse_article(url, html, custom_method)
+            return self._cache_put(cache_key, article_data)
 
         except Exception as e:
             logger.error(f"Error scraping article: {str(e)}")
             raise ValueError(f"Failed to scrape article: {str(e)}")
 
-    def _scrape_with_newspaper(self, url: str) -> Optional[Dict]:
-        """Try scraping with newspaper3k library"""
-        try:
-            article = Article(url)
-            article.download()
-            article.parse()
-
-            if not article.text or len(article.text.strip()) < 100:
-                return None
-
-            return {
-                'title': article.title.strip() if article.title else "Unknown Title",
-                'text': article.text.strip(),
-                'authors': article.authors if article.authors else [],
-                'publish_date': article.publish_date.isoformat() if article.publish_date else None,
-                'summary': article.summary.strip() if article.summary else "",
-                'url': url,
-                'domain': urlparse(url).netloc,
-                'word_count': len(article.text.split()),
-                'scraper_method': 'newspaper3k'
-            }
-        except Exception as e:
-            logger.warning(f"Newspaper3k scraping failed: {str(e)}")
+    def _cache_get(self, key: str) -> Optional[Dict]:
+        """Look up a cached article that has not expired"""
+        with self._cache_lock:
+            article_data = self._cache.get(key)
+        if article_data is None:
             return None
+        # Callers may modify the result (e.g. replace the title)
+        return dict(article_data)
 
-    def _scrape_custom(self, url: str) -> Optional[Dict]:
-        """Custom scraping method for better content extraction"""
-        try:
-            response = self.session.get(url, timeout=15, allow_redirects=True)
-
-            # Handle different HTTP status codes
-            if response.status_code == 403:
-                logger.warning(f"Access forbidden (403) for URL: {url}")
-                # Try with different headers
-                return self._scrape_with_different_headers(url)
-            elif response.status_code == 404:
-                raise ValueError(f"Page not found (404) for URL: {url}")
-            elif response.status_code == 429:
-                logger.warning("Rate limited, waiting before retry...")
-                time.sleep(2)
-                return self._scrape_with_different_headers(url)
-            elif not response.status_code == 200:
-                response.raise_for_status()
+    def _cache_put(self, key: str, article_data: Dict) -> Dict:
+        """Cache a scraped article until ARTICLE_CACHE_TTL passes"""
+        with self._cache_lock:
+            self._cache[key] = dict(article_data)
+        return article_data
 
-            soup = BeautifulSoup(response.content, 'lxml')
-            self.current_url = url  # Store URL for domain detection
-
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-
-            # Try to find main content
-            content = self._extract_main_content(soup)
-            if not content or len(content.strip()) < 100:
-                return None
-
-            # Extract title
-            title = self._extract_title(soup) or "Unknown Title"
-
-            # Extract metadata
-            authors = self._extract_authors(soup)
-            publish_date = self._extract_publish_date(soup)
-
-            return {
-                'title': title.strip(),
-                'text': content.strip(),
-                'authors': authors,
-                'publish_date': publish_date,
-                'summary': self._generate_summary(content),
-                'url': url,
-                'domain': urlparse(url).netloc,
-                'word_count': len(content.split()),
-                'scraper_method': 'custom'
-            }
-        except Exception as e:
-            logger.warning(f"Custom scraping failed: {str(e)}")
-            return None
+    def parse_article(self, url: str, html: str, custom_method: str = 'custom') -> Dict:
+        """
+        Extract article content from already downloaded HTML
+
+        Tries the newspaper3k, custom and basic parsers in turn; each later
+        parser only runs if the earlier ones found no valid article.
 
-    def _scrape_with_different_headers(self, url: str) -> Optional[Dict]:
-        """Try scraping with different headers to bypass restrictions"""
-        headers_list = [
-            {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            },
-            {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            },
-            {
-                'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            }
+        Args:
+            url (str): The URL the HTML was fetched from
+            html (str): The decoded page HTML
+            custom_method (str): scraper_method reported by the custom parser
+
+        Returns:
+            Dict: Article data with title, text, meta information
+        """
+        parsers = [
+            ('newspaper3k', lambda: self._parse_newspaper(url, html)),
+            ('custom', lambda: self._parse_custom(url, html, custom_method)),
+            ('basic', lambda: self._parse_basic(url, html)),
         ]
+        for method, parser in parsers:
+            try:
+                article_data = parser()
+            except Exception as e:
+                logger.warning(f"{method} parsing failed: {str(e)}")
+                continue
+            if article_data and self._validate_article(article_data):
+                logger.info(f"Successfully parsed with {method} method")
+                return article_data
+
+        raise ValueError("Could not extract valid article content")
+
+    def _fetch_html(self, url: str) -> Tuple[str, str]:
+        """
+        Download a page for parsing
 
-        for headers in headers_list:
+        Returns:
+            Tuple[str, str]: The decoded page HTML, and the scraper_method label for
+                the custom parser ('custom_with_headers' if the default headers
+                were refused)
+        """
+        cache_key = _url_cache_key(url)
+        cached = self._html_cache.get(cache_key) if self._html_cache is not None else None
+        if cached is not None and not cached.get('complete'):
+            # Written before only complete pages were cached; may be cut off
+            cached = None
+        headers = None
+        if cached is not None:
+            if time.time() - cached['fetched_at'] < HTML_CACHE_FRESH_SECONDS:
+                logger.info(f"Using cached HTML for: {url}")
+                return _decode_html(cached['html'], cached.get('charset')), 'custom'
+
+            # Revalidate: an unchanged page costs a 304 instead of the full body
+            headers = {}
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        with self.session.get(url, headers=headers, timeout=15, allow_redirects=True, stream=True) as response:
+            status_code = response.status_code
+            if status_code == 304 and cached is not None:
+                logger.info(f"Cached HTML still valid for: {url}")
+                self._store_html(cache_key, cached['html'], cached.get('charset'), cached['etag'], cached['last_modified'])
+                return _decode_html(cached['html'], cached.get('charset')), 'custom'
+            elif status_code not in (403, 404, 429):
+                # Other error statuses raise; any other response (200, 203 from
+                # a CDN, ...) carries the page
+                response.raise_for_status()
+                html, complete = _read_body(response)
+                charset = _header_charset(response.headers.get('Content-Type'))
+                if complete and 200 <= status_code < 300:
+                    self._store_html(cache_key, html, charset, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+                return _decode_html(html, charset), 'custom'
+
+        # Handle different HTTP status codes
+        if status_code == 404:
+            raise ValueError(f"Page not found (404) for URL: {url}")
+        elif status_code == 429:
+            logger.warning("Rate limited, waiting before retry...")
+            time.sleep(2)
+        else:
+            logger.warning(f"Access forbidden ({status_code}) for URL: {url}")
+
+        # Try with different headers
+        html = self._fetch_with_different_headers(url)
+        if html is None:
+            raise ValueError(f"Access forbidden ({status_code}) for URL: {url}")
+        return html, 'custom_with_headers'
+
+    def _store_html(self, key: str, html: bytes, charset: Optional[str], etag: Optional[str],
+                    last_modified: Optional[str]) -> None:
+        """Save a completely downloaded page, its header charset and its validators to the on-disk cache"""
+        if self._html_cache is None:
+            return
+
+        entry = {
+            'html': html,
+            'charset': charset,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': time.time(),
+            'complete': True
+        }
+        try:
+            self._html_cache.set(key, entry, expire=HTML_CACHE_EXPIRE_SECONDS)
+        except Exception as e:
+            logger.warning(f"HTML cache write failed: {str(e)}")
+
+    def _fetch_with_different_headers(self, url: str) -> Optional[str]:
+        """Try downloading with different headers to bypass restrictions"""
+        for headers in FALLBACK_HEADERS:
             try:
-                self.session.headers.update(headers)
-                response = self.session.get(url, timeout=10)
-
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'lxml')
-                    self.current_url = url
-
-                    # Remove script and style elements
-                    for script in soup(["script", "style"]):
-                        script.decompose()
-
-                    # Try to find main content
-                    content = self._extract_main_content(soup)
-                    if content and len(content.strip()) > 100:
-                        title = self._extract_title(soup) or "Unknown Title"
-                        authors = self._extract_authors(soup)
-                        publish_date = self._extract_publish_date(soup)
-
-                        return {
-                            'title': title.strip(),
-                            'text': content.strip(),
-                            'authors': authors,
-                            'publish_date': publish_date,
-                            'summary': self._generate_summary(content),
-                            'url': url,
-                            'domain': urlparse(url).netloc,
-                            'word_count': len(content.split()),
-                            'scraper_method': 'custom_with_headers'
-                        }
+                # Per-request headers, so the shared session keeps its defaults
+                response = self.session.get(url, headers=headers, timeout=10)
+
+                if 200 <= response.status_code < 300:
+                    return _decode_html(response.content, _header_charset(response.headers.get('Content-Type')))
             except Exception as e:
                 logger.warning(f"Failed with headers {headers.get('User-Agent', 'unknown')}: {str(e)}")
                 continue
 
         return None
 
-    def _scrape_basic(self, url: str) -> Optional[Dict]:
-        """Basic HTML parsing as last resort"""
-        try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-
-            # Get all paragraph text
-            paragraphs = soup.find_all('p')
-            text_content = ' '.join([p.get_text().strip() for p in paragraphs if p.get_text().strip()])
-
-            if not text_content or len(text_content.strip()) < 100:
-                return None
-
-            return {
-                'title': self._extract_title(soup) or "Unknown Title",
-                'text': text_content.strip(),
-                'authors': [],
-                'publish_date': None,
-                'summary': self._generate_summary(text_content),
-                'url': url,
-                'domain': urlparse(url).netloc,
-                'word_count': len(text_content.split()),
-                'scraper_method': 'basic'
-            }
-        except Exception as e:
-            logger.warning(f"Basic scraping failed: {str(e)}")
+    def _parse_newspaper(self, url: str, html: str) -> Optional[Dict]:
+        """Run newspaper3k's extraction over downloaded HTML"""
+        article = Article(url)
+        article.download(input_html=html)
+        article.parse()
+        return self._article_data_from_newspaper(url, article)
+
+    def _article_data_from_newspaper(self, url: str, article: Article) -> Optional[Dict]:
+        """Article data from a parsed newspaper3k Article"""
+        if not article.text or len(article.text.strip()) < 100:
             return None
 
-    def _extract_main_content(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract main content from the page"""
-        # Store URL for domain detection
-        current_url = getattr(self, 'current_url', '')
-        domain = urlparse(current_url).netloc if current_url else ""
-
-        # Academic/research site specific selectors
-        academic_selectors = {
-            'dl.acm.org': [
-                '.abstract', '.abstractSection', '.article__abstract',
-                '.article-content', '.content', '.main-content',
-                '.paper-abstract', '.paper-content', '.full-text',
-                '.section-content', '.article-body', '.paper-body',
-                '.article-section', '.paper-section'
-            ],
-            'arxiv.org': [
-                '.abstract', '.content', '.paper-content',
-                '.article-content', '.main-content', '.abstract-text'
-            ],
-            'ieee.org': [
-                '.abstract', '.article-content', '.paper-content',
-                '.full-text', '.article-body', '.abstract-text'
-            ],
-            'springer.com': [
-                '.abstract', '.main-content', '.article-content',
-                '.content', '.paper-content', '.abstract-text'
-            ],
-            'sciencedirect.com': [
-                '.abstract', '.article-content', '.paper-content',
-                '.full-text', '.article-body', '.abstract-text'
-            ],
-            'researchgate.net': [
-                '.abstract', '.content', '.paper-content',
-                '.article-content', '.abstract-text'
-            ],
-            'academia.edu': [
-                '.abstract', '.content', '.paper-content',
-                '.article-content', '.abstract-text'
-            ]
+        return {
+            'title': article.title.strip() if article.title else "Unknown Title",
+            'text': article.text.strip(),
+            'authors': article.authors if article.authors else [],
+            'publish_date': article.publish_date.isoformat() if article.publish_date else None,
+            'summary': article.summary.strip() if article.summary else "",
+            'url': url,
+            'domain': urlparse(url).netloc,
+            'word_count': _count_words(article.text),
+            'scraper_method': 'newspaper3k'
         }
 
-        # Get selectors based on domain
-        selectors = []
-        for site_domain, site_selectors in academic_selectors.items():
-            if site_domain in domain:
-                selectors.extend(site_selectors)
-                logger.info(f"Using academic selectors for {site_domain}")
-                break
-
-        # Add general selectors
-        general_selectors = [
-            'article',
-            '[role="main"]',
-            '.content',
-            '.post-content',
-            '.entry-content',
-            '.article-content',
-            '.story-body',
-            'main',
-            '#content',
-            '#main',
-            '.post',
-            '.entry',
-            '.paper-content',
-            '.abstract',
-            '.article-body',
-            '.full-text',
-            '.main-content',
-            '.abstract-text',
-            '.paper-abstract',
-            '.research-paper',
-            '.academic-content'
-        ]
+    def _parse_custom(self, url: str, html: str, method: str = 'custom') -> Optional[Dict]:
+        """Extract article data from HTML using the content/title/author selectors"""
+        tree = _parse(html)
+        domain = urlparse(url).netloc
 
-        selectors.extend(general_selectors)
+        # JSON-LD metadata lives in script tags, so read it before they are removed
+        json_ld = _read_json_ld(tree)
 
-        # Try each selector
-        for selector in selectors:
-            content = soup.select_one(selector)
-            if content:
-                text = self._extract_text_from_element(content)
-                if text and len(text.strip()) > 100:
-                    logger.info(f"Found content using selector: {selector}")
-                    return text.strip()
+        # Remove script and style elements
+        tree.strip_tags(["script", "style"])
+
+        # Extract title and metadata while headers and bylines are still in the page
+        title = self._extract_title(tree, domain) or "Unknown Title"
+        authors = self._extract_authors(tree, domain)
+        publish_date = self._extract_publish_date(tree, json_ld)
+
+        # Remove page chrome once, up front: content candidates are collected
+        # before their text is read, so no node may be removed in between
+        tree.strip_tags(["nav", "header", "footer", "aside"])
+
+        # Try to find main content
+        content = self._extract_main_content(tree, domain)
+        if not content or len(content.strip()) < 100:
+            return None
+
+        return {
+            'title': title.strip(),
+            'text': content.strip(),
+            'authors': authors,
+            'publish_date': publish_date,
+            'summary': self._generate_summary(content),
+            'url': url,
+            'domain': domain,
+            'word_count': _count_words(content),
+            'scraper_method': method
+        }
+
+    def _parse_basic(self, url: str, html: str) -> Optional[Dict]:
+        """Extract article data from the page's paragraphs only"""
+        tree = _parse(html)
+
+        # Remove script and style elements
+        tree.strip_tags(["script", "style"])
+
+        # Get all paragraph text
+        paragraphs = (p.text().strip() for p in tree.css('p'))
+        text_content = ' '.join([text for text in paragraphs if text])
+
+        if not text_content or len(text_content.strip()) < 100:
+            return None
+
+        domain = urlparse(url).netloc
+        return {
+            'title': self._extract_title(tree, domain) or "Unknown Title",
+            'text': text_content.strip(),
+            'authors': [],
+            'publish_date': None,
+            'summary': self._generate_summary(text_content),
+            'url': url,
+            'domain': domain,
+            'word_count': _count_words(text_content),
+            'scraper_method': 'basic'
+        }
+
+    def _extract_main_content(self, tree: LexborHTMLParser, domain: str = "") -> Optional[str]:
+        """Extract main content from the page"""
+        # One query for all selectors; academic/research site specific ones come first
+        tried = set()
+        for content in tree.css(_selectors_for(domain).content):
+            # An element matching several selectors is returned once per selector
+            if content.mem_id in tried:
+                continue
+            tried.add(content.mem_id)
+
+            text = self._extract_text_from_element(content)
+            if text and len(text.strip()) > 100:
+                logger.info(f"Found content in <{content.tag}> element")
+                return text.strip()
 
         # Fallback: try to find content in structured academic format
-        academic_content = self._extract_academic_content(soup)
+        academic_content = self._extract_academic_content(tree)
         if academic_content:
             return academic_content
 
         return None
 
     def _extract_text_from_element(self, element) -> Optional[str]:
-        """Extract clean text from a BeautifulSoup element"""
+        """Extract clean text from a parsed HTML node (script, style and page chrome already removed)"""
         if not element:
             return None
 
-        # Remove script and style elements
-        for script in element(["script", "style", "nav", "header", "footer", "aside"]):
-            script.decompose()
-
         # Get text from various elements
         text_parts = []
 
-        # Try to get content from structured elements
-        for tag in ['p', 'div', 'section', 'article', 'span']:
-            elements = element.find_all(tag)
-            for elem in elements:
-                # Skip if it's a navigation, header, footer, or sidebar
-                class_attr = elem.get('class', [])
-                id_attr = elem.get('id', '')
-
-                skip_classes = ['nav', 'navigation', 'header', 'footer', 'sidebar', 'menu', 'breadcrumb', 'social', 'share', 'comment']
-                skip_ids = ['nav', 'navigation', 'header', 'footer', 'sidebar', 'menu', 'breadcrumb', 'social', 'share', 'comment']
-
-                if (any(cls in ' '.join(class_attr).lower() for cls in skip_classes) or
-                    any(skip_id in id_attr.lower() for skip_id in skip_ids)):
+        # Walk the subtree once in document order. Once an element's text is
+        # taken its descendants are not visited, so nested text is not repeated.
+        stack = list(element.iter())
+        stack.reverse()
+        while stack:
+            elem = stack.pop()
+
+            # Skip navigation, header, footer, or sidebar subtrees
+            attrs = elem.attributes
+            if attrs:
+                class_id = f"{attrs.get('class') or ''} {attrs.get('id') or ''}".lower()
+                if not _SKIP_TOKENS.isdisjoint(_ATTR_TOKEN_RE.split(class_id)):
                     continue
 
-                text = elem.get_text().strip()
+            if elem.tag in _TEXT_TAGS:
+                text = elem.text().strip()
                 if text and len(text) > 20:  # Minimum meaningful text length
                     text_parts.append(text)
+                    continue
+
+            children = list(elem.iter())
+            children.reverse()
+            stack.extend(children)
 
         if text_parts:
             return ' '.join(text_parts)
 
         return None
 
-    def _extract_academic_content(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_academic_content(self, tree: LexborHTMLParser) -> Optional[str]:
         """Extract content from academic/research paper structures"""
         text_parts = []
 
         # Look for abstract section
         abstract_selectors = ['.abstract', '.abstract-text', '.paper-abstract', '.article-abstract']
         for selector in abstract_selectors:
-            abstract = soup.select_one(selector)
+            abstract = tree.css_first(selector)
             if abstract:
-                abstract_text = abstract.get_text().strip()
+                abstract_text = abstract.text().strip()
                 if abstract_text and len(abstract_text) > 50:
                     text_parts.append(f"Abstract: {abstract_text}")
 
         # Look for main content sections
         content_selectors = ['.content', '.article-content', '.paper-content', '.main-content', '.article-body']
         for selector in content_selectors:
-            content = soup.select_one(selector)
+            content = tree.css_first(selector)
             if content:
                 text = self._extract_text_from_element(content)
                 if text:
                     text_parts.append(text)
 
         # Look for sections that might contain the main paper content
-        sections = soup.find_all(['section', 'div'], class_=re.compile(r'(content|paper|article|main|body)', re.I))
+        sections = [node for node in tree.css('section[class], div[class]')
+                    if _SECTION_RE.search(node.attributes.get('class') or '')]
         for section in sections:
             section_text = self._extract_text_from_element(section)
             if section_text and len(section_text) > 200:
@@ -393,163 +868,72 @@ class ArticleScraper:
 
         return None
 
-    def _extract_title(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_title(self, tree: LexborHTMLParser, domain: str = "") -> Optional[str]:
         """Extract article title"""
-        # Academic/research site specific title selectors
-        current_url = getattr(self, 'current_url', '')
-        domain = urlparse(current_url).netloc if current_url else ""
-
-        academic_title_selectors = {
-            'dl.acm.org': [
-                'h1', '.paper-title', '.article-title', '.citation__title',
-                '.publication-title', '.paper-header-title'
-            ],
-            'arxiv.org': [
-                'h1', '.title', '.paper-title', '.article-title'
-            ],
-            'ieee.org': [
-                'h1', '.paper-title', '.article-title', '.title'
-            ],
-            'springer.com': [
-                'h1', '.article-title', '.paper-title', '.title'
-            ],
-            'sciencedirect.com': [
-                'h1', '.article-title', '.paper-title', '.title'
-            ]
-        }
+        # Academic/research site specific title selectors, then general ones
+        for title_elem in tree.css(_selectors_for(domain).title):
+            title_text = title_elem.text().strip()
+            if title_text:
+                return title_text
 
-        # Get title selectors based on domain
-        title_selectors = []
-        for site_domain, selectors in academic_title_selectors.items():
-            if site_domain in domain:
-                title_selectors.extend(selectors)
-                break
-
-        # Add general selectors
-        general_selectors = [
-            'title',
-            'h1',
-            '.headline',
-            '.article-title',
-            '.entry-title',
-            '.post-title',
-            '[property="og:title"]',
-            'meta[property="og:title"]',
-            '.paper-title',
-            '.publication-title',
-            '.citation-title'
-        ]
-
-        title_selectors.extend(general_selectors)
-
-        for selector in title_selectors:
-            if selector.startswith('meta'):
-                # Handle meta tags
-                meta_tag = soup.find('meta', property='og:title') or soup.find('meta', {'name': 'title'})
-                if meta_tag and meta_tag.get('content'):
-                    return meta_tag['content']
-            else:
-                # Handle regular elements
-                title_elem = soup.select_one(selector)
-                if title_elem:
-                    title_text = title_elem.get_text().strip()
-                    if title_text:
-                        return title_text
+        # Handle meta tags
+        meta_tag = tree.css_first('meta[property="og:title"]') or tree.css_first('meta[name="title"]')
+        if meta_tag and meta_tag.attributes.get('content'):
+            return meta_tag.attributes['content']
 
         return None
 
-    def _extract_authors(self, soup: BeautifulSoup) -> list:
+    def _extract_authors(self, tree: LexborHTMLParser, domain: str = "") -> list:
         """Extract author information"""
-        authors = []
-
-        # Academic/research site specific author selectors
-        current_url = getattr(self, 'current_url', '')
-        domain = urlparse(current_url).netloc if current_url else ""
-
-        academic_author_selectors = {
-            'dl.acm.org': [
-                '.author', '.authors', '.citation-authors', '.paper-authors',
-                '.author-list', '.contributor-list', '.byline'
-            ],
-            'arxiv.org': [
-                '.authors', '.author', '.paper-authors', '.byline'
-            ],
-            'ieee.org': [
-                '.authors', '.author', '.paper-authors', '.byline'
-            ],
-            'springer.com': [
-                '.authors', '.author', '.paper-authors', '.byline'
-            ],
-            'sciencedirect.com': [
-                '.authors', '.author', '.paper-authors', '.byline'
-            ]
-        }
-
-        # Get author selectors based on domain
-        author_selectors = []
-        for site_domain, selectors in academic_author_selectors.items():
-            if site_domain in domain:
-                author_selectors.extend(selectors)
-                break
-
-        # Add general selectors
-        general_selectors = [
-            '.author',
-            '.authors',
-            '.byline',
-            '[rel="author"]',
-            '.entry-author',
-            '.post-author',
-            '[property="author"]',
-            '[property="article:author"]',
-            '.citation-authors',
-            '.paper-authors',
-            '.contributor-list'
-        ]
-
-        author_selectors.extend(general_selectors)
-
-        for selector in author_selectors:
-            author_elements = soup.select(selector)
-            for author_elem in author_elements:
-                author_text = author_elem.get_text().strip()
-                if author_text and len(author_text) > 2:
-                    # Clean up author text
-                    author_text = re.sub(r'\s+', ' ', author_text)
-                    if author_text not in authors:
-                        authors.append(author_text)
+        # Insertion-ordered set of author names
+        authors = {}
+
+        # Academic/research site specific author selectors, then general ones
+        for author_elem in tree.css(_selectors_for(domain).authors):
+            author_text = author_elem.text().strip()
+            if author_text and len(author_text) > 2:
+                # Clean up author text
+                authors[_WS_RE.sub(' ', author_text)] = None
+                if len(authors) >= MAX_AUTHORS:
+                    return list(authors)
 
         # Try to extract from meta tags
-        meta_authors = [
-            'meta[name="author"]',
-            'meta[property="article:author"]',
-            'meta[property="author"]'
-        ]
-
-        for meta_selector in meta_authors:
-            meta_tag = soup.select_one(meta_selector)
-            if meta_tag and meta_tag.get('content'):
-                author_names = meta_tag['content'].split(',')
+        for meta_selector in META_AUTHOR_SELECTORS:
+            meta_tag = tree.css_first(meta_selector)
+            if meta_tag and meta_tag.attributes.get('content'):
+                author_names = meta_tag.attributes['content'].split(',')
                 for name in author_names:
                     name = name.strip()
-                    if name and name not in authors:
-                        authors.append(name)
+                    if name:
+                        authors[name] = None
+                        if len(authors) >= MAX_AUTHORS:
+                            return list(authors)
 
-        return authors[:10]  # Limit to 10 authors
+        return list(authors)
 
-    def _extract_publish_date(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_publish_date(self, tree: LexborHTMLParser, json_ld: Optional[List[Dict]] = None) -> Optional[str]:
         """Extract publish date"""
-        # Look for common date patterns in text
-        date_patterns = [
-            r'\d{4}-\d{2}-\d{2}',  # YYYY-MM-DD
-            r'\d{2}/\d{2}/\d{4}',  # MM/DD/YYYY
-            r'\d{1,2}\s+\w+\s+\d{4}',  # DD Month YYYY
-        ]
-
-        text_content = soup.get_text()
-
-        for pattern in date_patterns:
-            match = re.search(pattern, text_content)
+        # Structured metadata first: Open Graph article tags, <time>, then JSON-LD
+        meta_tag = tree.css_first('meta[property="article:published_time"]')
+        if meta_tag and meta_tag.attributes.get('content'):
+            return meta_tag.attributes['content'].strip()
+
+        time_tag = tree.css_first('time[datetime]')
+        if time_tag and time_tag.attributes.get('datetime'):
+            return time_tag.attributes['datetime'].strip()
+
+        for item in json_ld or []:
+            date_published = item.get('datePublished')
+            if isinstance(date_published, str) and date_published.strip():
+                return date_published.strip()
+
+        # Look for common date patterns in the article text (or the page body
+        # when there is no <article>), rather than the whole document
+        container = tree.css_first('article') or tree.body
+        text_content = container.text() if container else ''
+
+        for pattern in _DATE_RES:
+            match = pattern.search(text_content)
             if match:
                 return match.group(0)
 
@@ -557,14 +941,18 @@ class ArticleScraper:
 
     def _generate_summary(self, text: str) -> str:
         """Generate a basic summary from text"""
-        sentences = re.split(r'[.!?]+', text.strip())
-        sentences = [s.strip() for s in sentences if s.strip()]
-
-        if not sentences:
+        # Return first 2-3 sentences as summary; stop scanning once they are found
+        summary_sentences = []
+        for match in _SENTENCE_RE.finditer(text):
+            sentence = match.group(0).strip()
+            if sentence:
+                summary_sentences.append(sentence)
+                if len(summary_sentences) == SUMMARY_SENTENCES:
+                    break
+
+        if not summary_sentences:
             return ""
 
-        # Return first 2-3 sentences as summary
-        summary_sentences = sentences[:3]
         return '. '.join(summary_sentences) + '.'
 
     def _validate_article(self, article_data: Dict) -> bool:
@@ -580,6 +968,11 @@ class ArticleScraper:
 
         return True
 
+@functools.lru_cache(maxsize=1)
+def _get_scraper() -> ArticleScraper:
+    """Shared scraper, so its connection pool is reused across calls"""
+    return ArticleScraper()
+
 def scrape_url(url: str) -> Dict:
     """
     Convenience function to scrape an article from URL
@@ -590,5 +983,99 @@ def scrape_url(url: str) -> Dict:
     Returns:
         Dict: Article data
     """
-    scraper = ArticleScraper()
-    return scraper.scrape_article(url)
\ No newline at end of file
+    return _get_scraper().scrape_article(url)
+
+async def scrape_url_async(url: str) -> Dict:
+    """
+    Scrape an article without blocking the event loop
+
+    The blocking scraper runs on a dedicated worker pool of
+    SCRAPE_MAX_CONCURRENCY threads, which caps the number of scrapes in flight.
+
+    Args:
+        url (str): The URL to scrape
+
+    Returns:
+        Dict: Article data
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_SCRAPE_EXECUTOR, _get_scraper().scrape_article, url)
+
+async def _fetch(session: aiohttp.ClientSession, url: str) -> str:
+    """
+    Download a page, retrying with backoff on 429/5xx and with other
+    browser headers on 403
+    """
+    fallback_headers = iter(FALLBACK_HEADERS)
+    headers = None
+    retries = 0
+
+    while True:
+        async with session.get(url, headers=headers, allow_redirects=True) as response:
+            status = response.status
+            if 200 <= status < 300:
+                return _decode_html(await response.read(), _header_charset(response.headers.get('Content-Type')))
+
+        if status == 404:
+            raise ValueError(f"Page not found (404) for URL: {url}")
+
+        if status == 403:
+            headers = next(fallback_headers, None)
+            if headers is not None:
+                logger.warning(f"Access forbidden (403) for URL: {url}, retrying with different headers")
+                continue
+
+        elif status in _RETRY_STATUSES and retries < _FETCH_RETRIES:
+            delay = _FETCH_BACKOFF * 2 ** retries
+            retries += 1
+            logger.warning(f"HTTP {status} for URL: {url}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            continue
+
+        raise ValueError(f"Failed to fetch {url}: HTTP {status}")
+
+async def scrape_urls(urls: List[str], concurrency: int = 64) -> List[Union[Dict, Exception]]:
+    """
+    Scrape many articles concurrently
+
+    Args:
+        urls (List[str]): The URLs to scrape
+        concurrency (int): Maximum number of downloads in flight
+
+    Returns:
+        List[Union[Dict, Exception]]: Article data for each URL, in order, or the
+            exception raised for a URL that could not be scraped
+    """
+    # The shared scraper, so batches and single scrapes share the article cache
+    scraper = _get_scraper()
+    sem = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(
+        limit=concurrency,
+        limit_per_host=8,
+        use_dns_cache=SCRAPE_DNS_CACHE_TTL > 0,
+        ttl_dns_cache=SCRAPE_DNS_CACHE_TTL or None,
+        keepalive_timeout=30
+    )
+
+    async def scrape_one(url: str) -> Dict:
+        cache_key = _url_cache_key(url)
+        cached = scraper._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            async with sem:
+                html = await _fetch(session, url)
+
+            # Parsing is CPU-bound; keep it off the event loop
+            article_data = await asyncio.to_thread(scraper.parse_article, url, html)
+            return scraper._cache_put(cache_key, article_data)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            raise ValueError(f"Failed to scrape article: {str(e)}")
+
+    async with aiohttp.ClientSession(
+        connector=connector,
+        headers=DEFAULT_HEADERS,
+        timeout=aiohttp.ClientTimeout(total=15)
+    ) as session:
+        return await asyncio.gather(*(scrape_one(url) for url in urls), return_exceptions=True)
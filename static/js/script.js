@@ -30,24 +30,17 @@ document.addEventListener('DOMContentLoaded', function() {
         showLoadingState();
 
         try {
-            // Make API request
+            // Make API request; results are streamed back one stage at a time
             const response = await fetch('/summarize', {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
+                    'Accept': 'application/x-ndjson',
                 },
                 body: JSON.stringify({ url: url })
             });
 
-            const data = await response.json();
-
-            if (data.success) {
-                // Display results
-                displayResults(data);
-            } else {
-                // Show error
-                showError(data.error || 'An error occurred during summarization');
-            }
+            await readStages(response, handleStage);
 
         } catch (error) {
             console.error('Error:', error);
@@ -58,6 +51,51 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     });
 
+    async function readStages(response, onStage) {
+        // Read the NDJSON body line by line as it arrives
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+
+        while (true) {
+            const { done, value } = await reader.read();
+            if (done) break;
+
+            buffer += decoder.decode(value, { stream: true });
+            const lines = buffer.split('\n');
+            buffer = lines.pop();
+            lines.filter(line => line.trim()).forEach(line => onStage(JSON.parse(line)));
+        }
+
+        if (buffer.trim()) {
+            onStage(JSON.parse(buffer));
+        }
+    }
+
+    function handleStage(message) {
+        switch (message.stage) {
+            case 'article':
+                // 'article' is sent again if the AI supplies a better title
+                if (resultsSection.classList.contains('d-none')) {
+                    showResultsSection();
+                }
+                displayArticleInfo(message.data);
+                break;
+            case 'extractive_summary':
+                displayExtractiveSummary(message.data);
+                break;
+            case 'keywords':
+                displayKeywords(message.data);
+                break;
+            case 'ai_summary':
+                displayAISummary(message.data);
+                break;
+            case 'error':
+                showError(message.error || 'An error occurred during summarization');
+                break;
+        }
+    }
+
     function isValidUrl(string) {
         try {
             const url = new URL(string);
@@ -101,21 +139,15 @@ document.addEventListener('DOMContentLoaded', function() {
         hideLoadingState();
     }
 
-    function displayResults(data) {
-        // Hide error state
+    function showResultsSection() {
+        // Hide error and loading states
         errorState.classList.add('d-none');
+        loadingState.classList.add('d-none');
 
-        // Display article info
-        displayArticleInfo(data.article);
-
-        // Display extractive summary
-        displayExtractiveSummary(data.extractive_summary);
-
-        // Display keywords
-        displayKeywords(data.keywords);
-
-        // Display AI summary
-        displayAISummary(data.ai_summary);
+        // Show placeholders until each stage arrives
+        ['extractiveSummary', 'keywords', 'abstractiveSummary'].forEach(id => {
+            document.getElementById(id).innerHTML = '<p class="text-muted">Processing...</p>';
+        });
 
         // Show results section with fade-in animation
         resultsSection.classList.remove('d-none');
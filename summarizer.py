@@ -4,14 +4,14 @@ Text summarization and keyword extraction module
 
 import re
 import math
-from typing import List, Dict, Tuple, Set
+import functools
+from typing import Any, List, Dict, FrozenSet, Sequence, Tuple, Set
 from collections import Counter, defaultdict
 import nltk
-from nltk.tokenize import sent_tokenize, word_tokenize
-from nltk.corpus import stopwords
+from nltk.tokenize import RegexpTokenizer, sent_tokenize
+from nltk.corpus import stopwords, wordnet
 from nltk.stem import WordNetLemmatizer
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.feature_extraction.text import CountVectorizer, TfidfTransformer
 import numpy as np
 from sumy.parsers.plaintext import PlaintextParser
 from sumy.nlp.tokenizers import Tokenizer
@@ -22,12 +22,121 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Shared NLTK resources, loaded once at import: NLTK's lazy corpus loaders
+# are not thread-safe, and summarizers run in worker threads
+_STOP_WORDS = frozenset(stopwords.words('english'))
+_LEMMATIZER = WordNetLemmatizer()
+wordnet.ensure_loaded()
+
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_WS_RE = re.compile(r'\s+')
+
+@functools.lru_cache(maxsize=200000)
+def _lemma(word: str) -> str:
+    """WordNet lemma of a word, cached since the same words recur across calls"""
+    return _LEMMATIZER.lemmatize(word)
+
+@functools.lru_cache(maxsize=4096)
+def _preprocess(text: str) -> str:
+    """Lowercased, punctuation-free, lemmatized text (cached by input)"""
+    # Convert to lowercase
+    text = text.lower()
+
+    # Remove punctuation and special characters
+    text = _PUNCT_RE.sub('', text)
+
+    # Remove extra whitespace
+    text = _WS_RE.sub(' ', text).strip()
+
+    # Lemmatize words
+    return ' '.join(_lemma(word) for word in text.split())
+
+# Runs of four or more letters, the only tokens that can become keywords
+_KEYWORD_TOKENIZER = RegexpTokenizer(r'[^\W\d_]{4,}')
+
+@functools.lru_cache(maxsize=32)
+def _content_words(text: str) -> Tuple[str, ...]:
+    """
+    Lemmatized non-stopwords of a text longer than three letters, in order
+
+    Tokens are filtered with the cheap checks first, so only likely keywords
+    are lemmatized; lemmas are checked again since they can be shorter
+    (e.g. buses -> bus).
+    """
+    words = []
+    for token in _KEYWORD_TOKENIZER.tokenize(text.lower()):
+        if token in _STOP_WORDS:
+            continue
+        word = _lemma(token)
+        if len(word) > 3 and word not in _STOP_WORDS:
+            words.append(word)
+    return tuple(words)
+
+# Vocabulary sizes of the TF-IDF views used for sentence scoring and keywords
+SENTENCE_FEATURES = 1000
+KEYWORD_FEATURES = 100
+
+@functools.lru_cache(maxsize=32)
+def _split_sentences(text: str) -> Tuple[str, ...]:
+    """Sentences of a text, split once for the summary and keyword extractors"""
+    return tuple(sent_tokenize(text))
+
+@functools.lru_cache(maxsize=32)
+def _word_sets(sentences: Tuple[str, ...]) -> Tuple[FrozenSet[str], ...]:
+    """Preprocessed word set of each sentence, shared by title scoring and the diversity check"""
+    return tuple(frozenset(_preprocess(sentence).split()) for sentence in sentences)
+
+@functools.lru_cache(maxsize=32)
+def _count_terms(sentences: Tuple[str, ...]) -> Tuple[Any, np.ndarray]:
+    """
+    Term counts of each sentence, tokenized and counted once
+
+    Both TF-IDF views (sentence scoring and keywords) are weighted from these
+    counts rather than fitting a vectorizer each. The results are shared
+    between callers and must not be modified.
+
+    Returns:
+        Tuple[scipy.sparse.csr_matrix, np.ndarray]: Sentence-by-term counts and
+            the term for each column, in alphabetical order
+    """
+    vectorizer = CountVectorizer(stop_words='english')
+    counts = vectorizer.fit_transform(sentences)
+    return counts, vectorizer.get_feature_names_out()
+
+@functools.lru_cache(maxsize=32)
+def _sentence_tfidf(sentences: Tuple[str, ...]) -> Tuple[Any, np.ndarray]:
+    """
+    TF-IDF vectors of each sentence and of the whole document
+
+    Shared by sentence scoring and the diversity check; must not be modified.
+
+    Returns:
+        Tuple[scipy.sparse.csr_matrix, np.ndarray]: L2-normalized sentence rows,
+            and the (unnormalized) document vector
+    """
+    counts, _ = _most_frequent_terms(*_count_terms(sentences), SENTENCE_FEATURES)
+    transformer = TfidfTransformer()
+    tfidf_matrix = transformer.fit_transform(counts)
+
+    # The document's term counts are the sum of the sentence counts
+    doc_vector = np.asarray(counts.sum(axis=0)).ravel() * transformer.idf_
+    return tfidf_matrix, doc_vector
+
+def _most_frequent_terms(counts, feature_names: np.ndarray, max_features: int) -> Tuple[Any, np.ndarray]:
+    """Keep the max_features most frequent terms, as TfidfVectorizer(max_features=...) would"""
+    term_frequencies = np.asarray(counts.sum(axis=0)).ravel()
+    if len(term_frequencies) <= max_features:
+        return counts, feature_names
+
+    columns = np.sort((-term_frequencies).argsort()[:max_features])
+    return counts[:, columns], feature_names[columns]
+
 class TextSummarizer:
     """Main summarization class handling extractive and abstractive summarization"""
 
     def __init__(self):
-        self.stop_words = set(stopwords.words('english'))
-        self.lemmatizer = WordNetLemmatizer()
+        self.stop_words = _STOP_WORDS
+        self.lemmatizer = _LEMMATIZER
 
     def extractive_summarize(self, text: str, num_sentences: int = 5) -> Dict:
         """
@@ -42,7 +151,7 @@ class TextSummarizer:
         """
         try:
             # Preprocess text
-            sentences = sent_tokenize(text)
+            sentences = list(_split_sentences(text))
             if len(sentences) <= num_sentences:
                 return {
                     'summary': text,
@@ -67,7 +176,7 @@ class TextSummarizer:
                 'method': 'extractive',
                 'original_length': len(sentences),
                 'summary_length': len(top_sentences),
-                'sentence_scores': sentence_scores
+                'sentence_scores': dict(enumerate(sentence_scores.tolist()))
             }
 
         except Exception as e:
@@ -123,10 +232,8 @@ class TextSummarizer:
                 'error': str(e)
             }
 
-    def _calculate_sentence_scores(self, sentences: List[str], full_text: str) -> Dict[int, float]:
-        """Calculate importance scores for each sentence"""
-        scores = {}
-
+    def _calculate_sentence_scores(self, sentences: List[str], full_text: str) -> np.ndarray:
+        """Calculate importance scores for each sentence, as an array indexed by sentence"""
         # Method 1: TF-IDF sentence similarity
         tfidf_scores = self._tfidf_sentence_scoring(sentences)
 
@@ -140,151 +247,134 @@ class TextSummarizer:
         title_scores = self._title_overlap_scoring(sentences, full_text)
 
         # Combine all scores
-        for i, sentence in enumerate(sentences):
-            combined_score = (
-                tfidf_scores.get(i, 0) * 0.4 +
-                position_scores.get(i, 0) * 0.2 +
-                length_scores.get(i, 0) * 0.2 +
-                title_scores.get(i, 0) * 0.2
-            )
-            scores[i] = combined_score
-
-        return scores
-
-    def _tfidf_sentence_scoring(self, sentences: List[str]) -> Dict[int, float]:
+        return (
+            tfidf_scores * 0.4 +
+            position_scores * 0.2 +
+            length_scores * 0.2 +
+            title_scores * 0.2
+        )
+
+    def _tfidf_sentence_scoring(self, sentences: List[str]) -> np.ndarray:
         """Score sentences using TF-IDF similarity"""
-        scores = {}
-
         if len(sentences) < 3:
-            return {i: 1.0 for i in range(len(sentences))}
+            return np.ones(len(sentences))
 
         try:
             # Create TF-IDF vectors for sentences
-            vectorizer = TfidfVectorizer(stop_words='english', max_features=1000)
-            tfidf_matrix = vectorizer.fit_transform(sentences)
-
-            # Calculate similarity with the entire document
-            doc_vector = vectorizer.transform([' '.join(sentences)])
-            similarities = cosine_similarity(tfidf_matrix, doc_vector)
+            tfidf_matrix, doc_vector = _sentence_tfidf(tuple(sentences))
 
-            for i, similarity in enumerate(similarities):
-                scores[i] = float(similarity[0])
+            # Calculate similarity with the entire document. Sentence rows are
+            # already L2-normalized, so cosine similarity is one sparse product
+            # with the normalized (dense) document vector.
+            doc_norm = np.linalg.norm(doc_vector)
+            if not doc_norm:
+                return np.zeros(len(sentences))
+            return tfidf_matrix @ (doc_vector / doc_norm)
 
         except Exception as e:
             logger.warning(f"TF-IDF scoring failed: {str(e)}")
-            scores = {i: 1.0 for i in range(len(sentences))}
+            return np.ones(len(sentences))
 
-        return scores
-
-    def _position_scoring(self, sentences: List[str]) -> Dict[int, float]:
+    def _position_scoring(self, sentences: List[str]) -> np.ndarray:
         """Score sentences based on position"""
-        scores = {}
         total_sentences = len(sentences)
-
-        for i in range(total_sentences):
-            # Earlier sentences get higher scores, but not the very first (which might be intro)
-            if i == 0:
-                scores[i] = 0.5  # Introduction sentence
-            elif i < total_sentences * 0.3:
-                scores[i] = 1.0  # Early sentences
-            elif i < total_sentences * 0.7:
-                scores[i] = 0.7  # Middle sentences
-            else:
-                scores[i] = 0.3  # Later sentences
-
-        return scores
-
-    def _length_scoring(self, sentences: List[str]) -> Dict[int, float]:
+        positions = np.arange(total_sentences)
+
+        # Earlier sentences get higher scores, but not the very first (which might be intro)
+        return np.select(
+            [
+                positions == 0,  # Introduction sentence
+                positions < total_sentences * 0.3,  # Early sentences
+                positions < total_sentences * 0.7,  # Middle sentences
+            ],
+            [0.5, 1.0, 0.7],
+            default=0.3  # Later sentences
+        )
+
+    def _length_scoring(self, sentences: List[str]) -> np.ndarray:
         """Score sentences based on length"""
-        scores = {}
-        lengths = [len(sentence.split()) for sentence in sentences]
-        avg_length = sum(lengths) / len(lengths)
-
-        for i, length in enumerate(lengths):
-            # Optimal sentence length is around average
-            if abs(length - avg_length) < avg_length * 0.3:
-                scores[i] = 1.0
-            elif length > avg_length * 1.5:
-                scores[i] = 0.5  # Too long
-            else:
-                scores[i] = 0.8
-
-        return scores
-
-    def _title_overlap_scoring(self, sentences: List[str], full_text: str) -> Dict[int, float]:
+        lengths = np.fromiter((len(sentence.split()) for sentence in sentences), dtype=np.int64, count=len(sentences))
+        avg_length = lengths.sum() / len(lengths)
+
+        # Optimal sentence length is around average
+        return np.select(
+            [
+                np.abs(lengths - avg_length) < avg_length * 0.3,
+                lengths > avg_length * 1.5,  # Too long
+            ],
+            [1.0, 0.5],
+            default=0.8
+        )
+
+    def _title_overlap_scoring(self, sentences: List[str], full_text: str) -> np.ndarray:
         """Score sentences based on overlap with title-like content"""
-        scores = {}
+        sent_sets = _word_sets(tuple(sentences))
 
         # Extract first sentence as potential title
-        first_sentence = sentences[0] if sentences else ""
-        title_words = set(self._preprocess_text(first_sentence).split())
+        title_words = sent_sets[0] if sent_sets else frozenset()
 
-        for i, sentence in enumerate(sentences):
-            sentence_words = set(self._preprocess_text(sentence).split())
-            overlap = len(title_words.intersection(sentence_words))
-            total_words = len(title_words.union(sentence_words))
+        # Jaccard index of each sentence's words with the title's
+        return np.fromiter(
+            (len(title_words & words) / (len(title_words | words) or 1) for words in sent_sets),
+            dtype=np.float64,
+            count=len(sent_sets)
+        )
 
-            if total_words > 0:
-                scores[i] = overlap / total_words
-            else:
-                scores[i] = 0.0
-
-        return scores
-
-    def _select_top_sentences(self, sentences: List[str], scores: Dict[int, float],
+    def _select_top_sentences(self, sentences: List[str], scores: np.ndarray,
                             num_sentences: int) -> List[str]:
         """Select top sentences based on scores"""
-        # Sort sentences by score
-        scored_sentences = [(i, score) for i, score in scores.items()]
-        scored_sentences.sort(key=lambda x: x[1], reverse=True)
+        # Sentence indices by score, highest first (ties keep document order)
+        ranked_indices = np.argsort(-scores, kind='stable').tolist()
+
+        # Compare sentences by the cosine similarity of their TF-IDF vectors,
+        # or by word overlap if the text has no usable vocabulary
+        try:
+            tfidf_matrix, _ = _sentence_tfidf(tuple(sentences))
+            sent_sets = None
+        except ValueError:
+            tfidf_matrix = None
+            sent_sets = _word_sets(tuple(sentences))
 
         # Select top sentences, ensuring diversity
         selected_indices = []
         selected_sentences = []
 
-        for index, score in scored_sentences:
+        for index in ranked_indices:
             if len(selected_sentences) >= num_sentences:
                 break
 
             # Check similarity with already selected sentences
-            sentence_text = sentences[index]
-            is_similar = False
-
-            for selected_sentence in selected_sentences:
-                similarity = self._calculate_sentence_similarity(sentence_text, selected_sentence)
-                if similarity > 0.7:  # Too similar
-                    is_similar = True
-                    break
+            if not selected_indices:
+                is_similar = False
+            elif tfidf_matrix is not None:
+                # Rows are L2-normalized, so dot products are cosine similarities
+                similarities = (tfidf_matrix[selected_indices] @ tfidf_matrix[index].T).toarray()
+                is_similar = similarities.max() > 0.7  # Too similar
+            else:
+                is_similar = any(
+                    self._calculate_sentence_similarity(sent_sets[index], sent_sets[selected]) > 0.7  # Too similar
+                    for selected in selected_indices
+                )
 
             if not is_similar:
-                selected_sentences.append(sentence_text)
+                selected_sentences.append(sentences[index])
                 selected_indices.append(index)
 
         return selected_sentences
 
-    def _calculate_sentence_similarity(self, sentence1: str, sentence2: str) -> float:
-        """Calculate similarity between two sentences"""
-        try:
-            words1 = set(self._preprocess_text(sentence1).split())
-            words2 = set(self._preprocess_text(sentence2).split())
-
-            intersection = len(words1.intersection(words2))
-            union = len(words1.union(words2))
-
-            return intersection / union if union > 0 else 0.0
-        except:
-            return 0.0
+    def _calculate_sentence_similarity(self, words1: Set[str], words2: Set[str]) -> float:
+        """Calculate similarity (Jaccard index) between two sentences' word sets"""
+        union = len(words1 | words2)
+        return len(words1 & words2) / union if union > 0 else 0.0
 
     def _extract_tfidf_keywords(self, text: str, num_keywords: int) -> List[Tuple[str, float]]:
         """Extract keywords using TF-IDF"""
         try:
-            sentences = sent_tokenize(text)
-            vectorizer = TfidfVectorizer(max_features=100, stop_words='english')
-            tfidf_matrix = vectorizer.fit_transform(sentences)
+            counts, feature_names = _most_frequent_terms(*_count_terms(_split_sentences(text)), KEYWORD_FEATURES)
 
             # Get feature names and scores
-            feature_names = vectorizer.get_feature_names_out()
-            scores = tfidf_matrix.toarray().sum(axis=0)
+            tfidf_matrix = TfidfTransformer().fit_transform(counts)
+            scores = np.asarray(tfidf_matrix.sum(axis=0)).ravel()
 
             # Create keyword-score pairs
             keywords = [(feature_names[i], scores[i]) for i in range(len(feature_names))]
@@ -299,17 +389,7 @@ class TextSummarizer:
         """Extract keywords using TextRank"""
         try:
             # Simple TextRank implementation for keywords
-            sentences = sent_tokenize(text)
-            words = [word for sentence in sentences for word in word_tokenize(sentence)]
-
-            # Filter and preprocess words
-            filtered_words = []
-            for word in words:
-                word = self._preprocess_text(word)
-                if (word and len(word) > 3 and
-                    word not in self.stop_words and
-                    word.isalpha()):
-                    filtered_words.append(word)
+            filtered_words = _content_words(text)
 
             # Calculate word scores using TextRank-like algorithm
             word_scores = self._textrank_scoring(filtered_words)
@@ -325,15 +405,7 @@ class TextSummarizer:
     def _extract_frequency_keywords(self, text: str, num_keywords: int) -> List[Tuple[str, float]]:
         """Extract keywords based on frequency"""
         try:
-            words = word_tokenize(text.lower())
-            filtered_words = []
-
-            for word in words:
-                word = self._preprocess_text(word)
-                if (word and len(word) > 3 and
-                    word not in self.stop_words and
-                    word.isalpha()):
-                    filtered_words.append(word)
+            filtered_words = _content_words(text)
 
             # Calculate frequency
             word_freq = Counter(filtered_words)
@@ -347,25 +419,24 @@ class TextSummarizer:
             logger.warning(f"Frequency keyword extraction failed: {str(e)}")
             return []
 
-    def _textrank_scoring(self, words: List[str]) -> Dict[str, float]:
+    def _textrank_scoring(self, words: Sequence[str]) -> Dict[str, float]:
         """Simple TextRank-like scoring for words"""
-        scores = {word: 1.0 for word in set(words)}
+        # Co-occurring words (simple window-based), counted once over every
+        # occurrence of each word
+        neighbors = defaultdict(Counter)
+        for i, word in enumerate(words):
+            neighbors[word].update(w for w in words[max(0, i - 5):i + 6] if w != word)
+        degrees = {word: sum(counts.values()) for word, counts in neighbors.items()}
+
+        scores = {word: 1.0 for word in neighbors}
 
         # Simple iterative scoring
         for _ in range(5):  # 5 iterations
-            new_scores = scores.copy()
-            for word in words:
-                # Find co-occurring words (simple window-based)
-                word_index = words.index(word)
-                window_start = max(0, word_index - 5)
-                window_end = min(len(words), word_index + 6)
-                window_words = [w for w in words[window_start:window_end] if w != word]
-
-                if window_words:
-                    score_sum = sum(scores[w] for w in window_words if w in scores)
-                    new_scores[word] = 0.15 + 0.85 * (score_sum / len(window_words))
-
-            scores = new_scores
+            scores = {
+                word: 0.15 + 0.85 * sum(scores[w] * count for w, count in neighbors[word].items()) / degrees[word]
+                if degrees[word] else score
+                for word, score in scores.items()
+            }
 
         return scores
 
@@ -389,27 +460,17 @@ class TextSummarizer:
 
     def _preprocess_text(self, text: str) -> str:
         """Preprocess text for analysis"""
-        # Convert to lowercase
-        text = text.lower()
-
-        # Remove punctuation and special characters
-        text = re.sub(r'[^\w\s]', '', text)
-
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-
-        # Lemmatize words
-        words = text.split()
-        lemmatized_words = [self.lemmatizer.lemmatize(word) for word in words]
+        return _preprocess(text)
 
-        return ' '.join(lemmatized_words)
+@functools.lru_cache(maxsize=1)
+def _get_summarizer() -> TextSummarizer:
+    """Shared summarizer; it only holds read-only resources, so calls can share it"""
+    return TextSummarizer()
 
 def extractive_summarize(text: str, num_sentences: int = 5) -> Dict:
     """Convenience function for extractive summarization"""
-    summarizer = TextSummarizer()
-    return summarizer.extractive_summarize(text, num_sentences)
+    return _get_summarizer().extractive_summarize(text, num_sentences)
 
 def extract_keywords(text: str, num_keywords: int = 10) -> Dict:
     """Convenience function for keyword extraction"""
-    summarizer = TextSummarizer()
-    return summarizer.extract_keywords(text, num_keywords)
\ No newline at end of file
+    return _get_summarizer().extract_keywords(text, num_keywords)
\ No newline at end of file
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test the scraper session's DNS cache against a local HTTPS server
+"""
+
+import http.server
+import os
+import shutil
+import socket
+import ssl
+import subprocess
+import sys
+import threading
+
+import pytest
+import requests
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import scraper
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = self.headers['Host'].encode()
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def https_server(tmp_path):
+    """HTTPS server on 127.0.0.1 whose certificate is only valid for 'localhost'"""
+    if shutil.which('openssl') is None:
+        pytest.skip("openssl is needed to create the test certificate")
+
+    certfile, keyfile = tmp_path / 'cert.pem', tmp_path / 'key.pem'
+    subprocess.run(
+        ['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+         '-subj', '/CN=localhost', '-addext', 'subjectAltName=DNS:localhost',
+         '-keyout', str(keyfile), '-out', str(certfile)],
+        check=True, capture_output=True
+    )
+
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(certfile, keyfile)
+    server = http.server.HTTPServer(('127.0.0.1', 0), _Handler)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address[1], str(certfile)
+    server.shutdown()
+    server.server_close()
+
+def test_cached_dns_keeps_hostname_verification(https_server, monkeypatch):
+    """Hosts are looked up once, and TLS is still checked against the hostname"""
+    port, certfile = https_server
+    lookups = []
+
+    def getaddrinfo(host, port, *args):
+        # urllib3 also passes the cached IP address through getaddrinfo
+        if host != '127.0.0.1':
+            lookups.append(host)
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('127.0.0.1', port))]
+
+    monkeypatch.setattr(scraper.socket, 'getaddrinfo', getaddrinfo)
+    monkeypatch.setattr(scraper, '_DNS_CACHE', scraper.TTLCache(maxsize=16, ttl=60))
+
+    session = requests.Session()
+    session.mount('https://', scraper._CachedDNSAdapter())
+
+    # The certificate has no IP address in it, so this only passes if the
+    # connection to the cached address is verified against 'localhost'
+    for _ in range(2):
+        response = session.get(f'https://localhost:{port}/', verify=certfile, timeout=5)
+        assert response.status_code == 200
+        assert response.text == f'localhost:{port}'
+        session.close()
+    assert lookups == ['localhost']
+
+    with pytest.raises(requests.exceptions.SSLError):
+        session.get(f'https://wrong.test:{port}/', verify=certfile, timeout=5)
+    assert lookups == ['localhost', 'wrong.test']
@@ -3,16 +3,152 @@ Input validation and error handling utilities
 """
 
 import re
-from typing import Dict, List, Optional, Any
-from urllib.parse import urlparse
+import functools
+from collections import Counter
+from typing import Dict, List, Optional, Any, Tuple
+from urllib.parse import urlparse, ParseResult
+import numpy as np
 import logging
 
 logger = logging.getLogger(__name__)
 
+_WORD_RE = re.compile(r'\b\w+\b')
+# Text between sentence-ending punctuation
+_SENTENCE_RE = re.compile(r'[^.!?]+')
+
+class _PrintableTable(dict):
+    """
+    str.translate table keeping printable ASCII and newlines, turning other
+    whitespace into spaces and dropping everything else. Filled in lazily, so
+    any code point (not just the BMP) is handled.
+    """
+
+    def __missing__(self, code: int) -> Optional[int]:
+        if code == 0x0A or 0x20 <= code <= 0x7E:
+            value = code
+        elif chr(code).isspace():
+            value = 0x20
+        else:
+            value = None
+        self[code] = value
+        return value
+
+_PRINTABLE_TABLE = _PrintableTable()
+
+# Runs of spaces, and whitespace runs containing line breaks
+_WHITESPACE_RUN_RE = re.compile(r'  +|[ \n]*\n[ \n]*')
+
+def _normalize_whitespace(match) -> str:
+    """One space, one line break, or one paragraph break (blank line) per run"""
+    newlines = match.group().count('\n')
+    if newlines == 0:
+        return ' '
+    return '\n' if newlines == 1 else '\n\n'
+
+# Character classes of ASCII code points; index 128 stands for any non-ASCII one
+_ASCII_UPPER = np.array([chr(code).isupper() for code in range(128)] + [False])
+_ASCII_PUNCTUATION = np.array([not chr(code).isalnum() and not chr(code).isspace() for code in range(128)] + [False])
+
+def _count_caps_and_punctuation(text: str) -> Tuple[int, int]:
+    """
+    Count uppercase and punctuation (neither alphanumeric nor whitespace) characters
+
+    ASCII characters are classified with vectorized table lookups over the
+    text's code points; each distinct non-ASCII character is classified once.
+    """
+    codes = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    ascii_index = np.minimum(codes, 128)
+    caps_count = int(np.count_nonzero(_ASCII_UPPER[ascii_index]))
+    punctuation_count = int(np.count_nonzero(_ASCII_PUNCTUATION[ascii_index]))
+
+    non_ascii = codes[codes >= 128]
+    if non_ascii.size:
+        for code, count in zip(*np.unique(non_ascii, return_counts=True)):
+            char = chr(code)
+            if char.isupper():
+                caps_count += int(count)
+            elif not char.isalnum() and not char.isspace():
+                punctuation_count += int(count)
+
+    return caps_count, punctuation_count
+
+# Basic domain format validation
+_DOMAIN_RE = re.compile(r'^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Domain name parts of known news sites
+_NEWS_DOMAINS = frozenset({
+    'news', 'cnn', 'bbc', 'reuters', 'apnews', 'nytimes', 'washingtonpost',
+    'theguardian', 'bloomberg', 'wsj', 'forbes', 'huffpost', 'abcnews',
+    'cbsnews', 'nbcnews', 'foxnews', 'usatoday', 'latimes', 'chicagotribune',
+    'bostonglobe', 'npr', 'pbs', 'time', 'newsweek', 'economist', 'ft.com'
+})
+
 class ValidationError(Exception):
     """Custom exception for validation errors"""
     pass
 
+@functools.lru_cache(maxsize=4096)
+def _check_url(url: str) -> Tuple[Optional[ParseResult], Optional[str]]:
+    """
+    Parse a stripped URL and check its length, scheme and domain
+
+    Cached, since batches repeat URLs; the result is the validation error
+    message rather than a raised exception so it can be cached too.
+
+    Returns:
+        Tuple[Optional[ParseResult], Optional[str]]: The parsed URL, or None
+            and why the URL is invalid
+    """
+    if len(url) > 2048:  # Reasonable URL length limit
+        return None, "URL is too long (max 2048 characters)"
+
+    # Parse URL
+    try:
+        parsed = urlparse(url)
+    except Exception as e:
+        return None, f"Invalid URL format: {str(e)}"
+
+    # Check scheme
+    if parsed.scheme not in ['http', 'https']:
+        return None, "URL must start with http:// or https://"
+
+    # Check domain
+    if not parsed.netloc:
+        return None, "URL must include a domain name"
+
+    # Basic domain format validation
+    if not _DOMAIN_RE.match(parsed.netloc):
+        return None, "Invalid domain format"
+
+    return parsed, None
+
+def _parse_and_validate(url: str) -> ParseResult:
+    """
+    Validate a URL, returning it parsed
+
+    Raises:
+        ValidationError: If URL is invalid
+    """
+    if not url or not isinstance(url, str):
+        raise ValidationError("URL cannot be empty")
+
+    # Basic URL format validation
+    parsed, error = _check_url(url.strip())
+    if error:
+        raise ValidationError(error)
+
+    return parsed
+
+@functools.lru_cache(maxsize=4096)
+def _domain_info(parsed: ParseResult) -> Dict[str, Any]:
+    """Domain information for a parsed URL (cached; callers get a copy)"""
+    return {
+        'domain': parsed.netloc,
+        'scheme': parsed.scheme,
+        'path': parsed.path,
+        'is_news_site': URLValidator._is_news_site(parsed.netloc)
+    }
+
 class URLValidator:
     """URL validation utilities"""
 
@@ -30,78 +166,41 @@ class URLValidator:
         Raises:
             ValidationError: If URL is invalid
         """
-        if not url or not isinstance(url, str):
-            raise ValidationError("URL cannot be empty")
-
-        # Basic URL format validation
-        url = url.strip()
-        if len(url) > 2048:  # Reasonable URL length limit
-            raise ValidationError("URL is too long (max 2048 characters)")
-
-        # Parse URL
-        try:
-            parsed = urlparse(url)
-        except Exception as e:
-            raise ValidationError(f"Invalid URL format: {str(e)}")
-
-        # Check scheme
-        if parsed.scheme not in ['http', 'https']:
-            raise ValidationError("URL must start with http:// or https://")
-
-        # Check domain
-        if not parsed.netloc:
-            raise ValidationError("URL must include a domain name")
-
-        # Basic domain format validation
-        domain_pattern = r'^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(domain_pattern, parsed.netloc):
-            raise ValidationError("Invalid domain format")
-
+        _parse_and_validate(url)
         return True
 
     @staticmethod
     def get_domain_info(url: str) -> Dict[str, str]:
         """Extract domain information from URL"""
         try:
-            parsed = urlparse(url)
-            return {
-                'domain': parsed.netloc,
-                'scheme': parsed.scheme,
-                'path': parsed.path,
-                'is_news_site': URLValidator._is_news_site(parsed.netloc)
-            }
+            return URLValidator.get_domain_info_from_parsed(urlparse(url))
         except Exception as e:
             logger.error(f"Error extracting domain info: {str(e)}")
             return {'domain': 'unknown', 'scheme': 'unknown', 'path': ''}
 
     @staticmethod
+    def get_domain_info_from_parsed(parsed: ParseResult) -> Dict[str, str]:
+        """Extract domain information from an already parsed URL"""
+        return dict(_domain_info(parsed))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _is_news_site(domain: str) -> bool:
         """Check if domain belongs to a known news site"""
-        news_domains = {
-            'news', 'cnn', 'bbc', 'reuters', 'apnews', 'nytimes', 'washingtonpost',
-            'theguardian', 'bloomberg', 'wsj', 'forbes', 'huffpost', 'abcnews',
-            'cbsnews', 'nbcnews', 'foxnews', 'usatoday', 'latimes', 'chicagotribune',
-            'bostonglobe', 'npr', 'pbs', 'time', 'newsweek', 'economist', 'ft.com'
-        }
-
-        domain_parts = domain.lower().split('.')
-        for part in domain_parts:
-            if part in news_domains:
-                return True
-
-        return False
+        return any(part in _NEWS_DOMAINS for part in domain.lower().split('.'))
 
 class TextValidator:
     """Text content validation utilities"""
 
     @staticmethod
-    def validate_article_text(text: str, min_length: int = 100) -> bool:
+    def validate_article_text(text: str, min_length: int = 100, words: Optional[List[str]] = None) -> bool:
         """
         Validate article text content
 
         Args:
             text (str): The text to validate
             min_length (int): Minimum required length
+            words (List[str], optional): Words of the text, if already tokenized
 
         Returns:
             bool: True if valid
@@ -121,7 +220,8 @@ class TextValidator:
             raise ValidationError("Article text is too long (max 100,000 characters)")
 
         # Check for actual content (not just whitespace/punctuation)
-        words = re.findall(r'\b\w+\b', text)
+        if words is None:
+            words = _WORD_RE.findall(text)
         if len(words) < 20:
             raise ValidationError("Article appears to contain insufficient readable content")
 
@@ -150,14 +250,11 @@ class TextValidator:
         if not text:
             return ""
 
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-
-        # Remove excessive newlines
-        text = re.sub(r'\n\s*\n\s*\n', '\n\n', text)
+        # Remove non-printable characters, in one pass
+        text = text.translate(_PRINTABLE_TABLE)
 
-        # Remove non-printable characters
-        text = re.sub(r'[^\x20-\x7E\n]', '', text)
+        # Remove excessive whitespace and newlines, keeping paragraph breaks
+        text = _WHITESPACE_RUN_RE.sub(_normalize_whitespace, text)
 
         return text.strip()
 
@@ -165,12 +262,13 @@ class ContentFilter:
     """Content filtering and quality assessment"""
 
     @staticmethod
-    def assess_content_quality(text: str) -> Dict[str, Any]:
+    def assess_content_quality(text: str, words: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Assess the quality of article content
 
         Args:
             text (str): The text to assess
+            words (List[str], optional): Words of the text, if already tokenized
 
         Returns:
             Dict: Quality metrics
@@ -186,14 +284,12 @@ class ContentFilter:
         }
 
         try:
-            # Basic metrics
-            words = re.findall(r'\b\w+\b', text)
-            sentences = re.split(r'[.!?]+', text)
-            paragraphs = [p for p in text.split('\n\n') if p.strip()]
-
+            # Basic metrics; sentences are counted without building a list
+            if words is None:
+                words = _WORD_RE.findall(text)
             metrics['word_count'] = len(words)
-            metrics['sentence_count'] = len([s for s in sentences if s.strip()])
-            metrics['paragraph_count'] = len(paragraphs)
+            metrics['sentence_count'] = sum(1 for s in _SENTENCE_RE.finditer(text) if not s.group().isspace())
+            metrics['paragraph_count'] = sum(1 for p in text.split('\n\n') if p.strip())
 
             if metrics['sentence_count'] > 0:
                 metrics['avg_sentence_length'] = metrics['word_count'] / metrics['sentence_count']
@@ -215,12 +311,13 @@ class ContentFilter:
         return metrics
 
     @staticmethod
-    def filter_inappropriate_content(text: str) -> Dict[str, Any]:
+    def filter_inappropriate_content(text: str, words: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Filter potentially inappropriate or low-quality content
 
         Args:
             text (str): The text to filter
+            words (List[str], optional): Words of the text, if already tokenized
 
         Returns:
             Dict: Filter results
@@ -232,16 +329,16 @@ class ContentFilter:
         }
 
         try:
-            text_lower = text.lower()
+            caps_count, punctuation_count = _count_caps_and_punctuation(text)
 
             # Check for excessive caps (shouting)
-            caps_ratio = sum(1 for c in text if c.isupper()) / len(text) if text else 0
+            caps_ratio = caps_count / len(text) if text else 0
             if caps_ratio > 0.3:
                 result['flags'].append('excessive_caps')
                 result['risk_score'] += 20
 
             # Check for excessive punctuation
-            punctuation_ratio = sum(1 for c in text if not c.isalnum() and not c.isspace()) / len(text) if text else 0
+            punctuation_ratio = punctuation_count / len(text) if text else 0
             if punctuation_ratio > 0.15:
                 result['flags'].append('excessive_punctuation')
                 result['risk_score'] += 10
@@ -252,13 +349,10 @@ class ContentFilter:
                 result['risk_score'] += 30
 
             # Check for repetitive content
-            words = re.findall(r'\b\w+\b', text_lower)
+            if words is None:
+                words = _WORD_RE.findall(text)
             if words:
-                word_counts = {}
-                for word in words:
-                    word_counts[word] = word_counts.get(word, 0) + 1
-
-                max_repetitions = max(word_counts.values()) if word_counts else 0
+                max_repetitions = Counter(map(str.lower, words)).most_common(1)[0][1]
                 if max_repetitions > len(words) * 0.1:  # Word repeated more than 10% of time
                     result['flags'].append('repetitive_content')
                     result['risk_score'] += 25
@@ -290,10 +384,10 @@ def validate_article_url(url: str) -> Dict[str, Any]:
     }
 
     try:
-        # URL format validation
-        URLValidator.validate_url(url)
+        # URL format validation, parsing the URL once for the domain info too
+        parsed = _parse_and_validate(url)
         result['is_valid'] = True
-        result['domain_info'] = URLValidator.get_domain_info(url)
+        result['domain_info'] = URLValidator.get_domain_info_from_parsed(parsed)
 
         # Additional checks
         if len(url) < 20:
@@ -331,8 +425,11 @@ def validate_article_content(title: str, text: str) -> Dict[str, Any]:
     }
 
     try:
+        # Tokenize once; the validation, quality and filter stages share the words
+        words = _WORD_RE.findall(text) if isinstance(text, str) else None
+
         # Text validation
-        TextValidator.validate_article_text(text)
+        TextValidator.validate_article_text(text, words=words)
         result['is_valid'] = True
 
         # Title validation
@@ -340,10 +437,10 @@ def validate_article_content(title: str, text: str) -> Dict[str, Any]:
             result['warnings'].append('Title seems too short or too long')
 
         # Quality assessment
-        result['quality_metrics'] = ContentFilter.assess_content_quality(text)
+        result['quality_metrics'] = ContentFilter.assess_content_quality(text, words)
 
         # Content filtering
-        result['filter_results'] = ContentFilter.filter_inappropriate_content(text)
+        result['filter_results'] = ContentFilter.filter_inappropriate_content(text, words)
 
         if not result['quality_metrics']['is_likely_article']:
             result['warnings'].append('Content might not be a proper article')